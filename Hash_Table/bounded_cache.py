@@ -0,0 +1,275 @@
+# Bounded cache: a HashTable (key → node) plus doubly linked lists of nodes.
+# The table finds a node in O(1); the lists keep the eviction order, and since
+# every node knows its prev and next it can be unlinked or moved in O(1) too.
+#
+#   lru  evict the least recently used entry (one list, most recent at the front)
+#   lfu  evict the least frequently used entry (one list per use count, LRU within a count)
+#   ttl  entries expire ttl seconds after they were written; evict the soonest to expire
+#
+# A ttl can also be given with lru / lfu: expired entries then count as misses.
+
+import functools
+import sys
+import time
+
+from hash_table import HashTable
+
+POLICIES = ("lru", "lfu", "ttl")
+_MISSING = object()
+_KWD_MARK = object()   # separates positional from keyword arguments in memoize keys
+
+
+class _Node:
+    __slots__ = ("key", "value", "prev", "next", "freq", "expires", "size")
+
+    def __init__(self, key=None, value=None):
+        self.key = key
+        self.value = value
+        self.prev = self.next = self
+        self.freq = 1
+        self.expires = None
+        self.size = 0
+
+
+class _NodeList:
+    """Circular doubly linked list around a sentinel node, so there are no head/tail special cases"""
+
+    def __init__(self):
+        self.root = _Node()
+        self.size = 0
+
+    def push_front(self, node):
+        node.prev, node.next = self.root, self.root.next
+        self.root.next.prev = node
+        self.root.next = node
+        self.size += 1
+
+    def unlink(self, node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        self.size -= 1
+
+    def back(self):
+        """Oldest node, or None when empty"""
+        return None if self.size == 0 else self.root.prev
+
+
+class Cache:
+    """Fixed-size cache with O(1) get and put.
+
+    capacity caps the number of entries; max_bytes (optional) additionally caps
+    sys.getsizeof(key) + sys.getsizeof(value) summed over all entries.
+    """
+
+    def __init__(self, capacity=128, policy="lru", ttl=None, max_bytes=None, clock=time.monotonic):
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}")
+        if policy == "ttl" and ttl is None:
+            raise ValueError("the ttl policy needs a ttl")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.policy = policy
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.table = HashTable()           # key → _Node
+        self.order = _NodeList()           # lru / ttl eviction order
+        self.freqs = HashTable()           # lfu: use count → _NodeList
+        self.min_freq = 0
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self):
+        return len(self.table)
+
+    def __contains__(self, key):
+        """True if key is cached and not expired; does not count as a use"""
+        node = self.table.get(key)
+        return node is not None and not self._expired(node)
+
+    def _expired(self, node):
+        return node.expires is not None and node.expires <= self.clock()
+
+    def _link(self, node):
+        """Put a node into the eviction structure as most recently used"""
+        if self.policy == "lfu":
+            bucket = self.freqs.get(node.freq)
+            if bucket is None:
+                bucket = self.freqs[node.freq] = _NodeList()
+            bucket.push_front(node)
+        else:
+            self.order.push_front(node)
+
+    def _unlink(self, node):
+        """Take a node out of the eviction structure"""
+        if self.policy != "lfu":
+            self.order.unlink(node)
+            return
+        bucket = self.freqs[node.freq]
+        bucket.unlink(node)
+        if bucket.size == 0:
+            del self.freqs[node.freq]
+            if self.min_freq == node.freq:
+                # Only on expiry / delete: the next lowest count has to be looked up
+                self.min_freq = min(self.freqs) if len(self.freqs) else 0
+
+    def _touch(self, node):
+        """Record a use of node"""
+        if self.policy == "lru":
+            self.order.unlink(node)
+            self.order.push_front(node)
+        elif self.policy == "lfu":
+            bucket = self.freqs[node.freq]
+            bucket.unlink(node)
+            if bucket.size == 0:
+                del self.freqs[node.freq]
+                if self.min_freq == node.freq:
+                    self.min_freq += 1   # node itself is about to be the only one there
+            node.freq += 1
+            self._link(node)
+
+    def _remove(self, node):
+        self._unlink(node)
+        del self.table[node.key]
+        self.bytes -= node.size
+
+    def _victim(self, skip=None):
+        """Next entry to evict, passing over skip; None if there is no other entry"""
+        if self.policy != "lfu":
+            return self._back(self.order, skip)
+        victim = self._back(self.freqs[self.min_freq], skip)
+        if victim is None and len(self.freqs) > 1:
+            # skip was alone at the lowest count: take from the next lowest one
+            victim = self.freqs[min(freq for freq in self.freqs if freq != self.min_freq)].back()
+        return victim
+
+    @staticmethod
+    def _back(nodes, skip):
+        """Oldest node of a list other than skip, or None"""
+        victim = nodes.back()
+        if victim is skip and victim is not None:
+            victim = victim.prev if victim.prev is not nodes.root else None
+        return victim
+
+    def get(self, key, default=None):
+        """Cached value for key (counts as a use), or default on a miss"""
+        node = self.table.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        if self._expired(node):
+            self._remove(node)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.value
+
+    def put(self, key, value):
+        """Cache value under key, evicting entries if the cache is full"""
+        size = sys.getsizeof(key) + sys.getsizeof(value) if self.max_bytes is not None else 0
+        expires = None if self.ttl is None else self.clock() + self.ttl
+
+        node = self.table.get(key)
+        if node is not None:
+            self.bytes += size - node.size
+            node.value, node.size, node.expires = value, size, expires
+            if self.policy == "ttl":
+                self._unlink(node)   # new expiry time → front of the expiry order
+                self._link(node)
+            else:
+                self._touch(node)    # rewriting counts as a use
+        else:
+            if self.policy == "ttl":
+                # The expiry order is the list order, so expired entries are all at the back
+                oldest = self.order.back()
+                while oldest is not None and self._expired(oldest):
+                    self._remove(oldest)
+                    self.expirations += 1
+                    oldest = self.order.back()
+            # Evict before linking, so an LFU cache never evicts the entry being added
+            while len(self.table) >= self.capacity:
+                self._evict()
+            node = _Node(key, value)
+            node.size, node.expires = size, expires
+            self.table[key] = node
+            self._link(node)
+            self.bytes += size
+            self.min_freq = 1
+
+        while self.max_bytes is not None and self.bytes > self.max_bytes:
+            victim = self._victim(skip=node)   # never evict the entry just written
+            if victim is None:
+                break                          # it is the only entry left
+            self._evict(victim)
+
+    def _evict(self, victim=None):
+        self._remove(victim or self._victim())
+        self.evictions += 1
+
+    def delete(self, key):
+        node = self.table.get(key)
+        if node is None:
+            raise KeyError(f"{key} not found")
+        self._remove(node)
+
+    def clear(self):
+        self.table.clear()
+        self.order = _NodeList()
+        self.freqs.clear()
+        self.min_freq = self.bytes = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "expirations": self.expirations, "size": len(self.table), "bytes": self.bytes}
+
+
+def memoize(capacity=128, policy="lru", ttl=None, max_bytes=None):
+    """Decorator caching a function's results by its (hashable) arguments.
+    The Cache is available as wrapper.cache."""
+    def decorator(func):
+        cache = Cache(capacity, policy, ttl, max_bytes)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + (_KWD_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+if __name__ == "__main__":
+    lru = Cache(capacity=2)
+    lru.put("march 6", 310)
+    lru.put("march 7", 340)
+    lru.get("march 6")              # march 7 is now least recently used
+    lru.put("march 8", 380)         # evicts march 7
+    print("LRU keeps march 6:", "march 6" in lru, "| evicted march 7:", "march 7" not in lru)
+
+    lfu = Cache(capacity=2, policy="lfu")
+    lfu.put("a", 1)
+    lfu.put("b", 2)
+    lfu.get("a")
+    lfu.get("a")
+    lfu.get("b")
+    lfu.put("c", 3)                 # evicts b (1 use) rather than a (2 uses)
+    print("LFU:", "a" in lfu, "b" in lfu, "c" in lfu)
+
+    ttl = Cache(capacity=10, policy="ttl", ttl=0.05)
+    ttl.put("x", 1)
+    time.sleep(0.06)
+    print("TTL expired:", ttl.get("x") is None, ttl.stats())
+
+    @memoize(capacity=1000)
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print("fib(200) =", fib(200), fib.cache.stats())
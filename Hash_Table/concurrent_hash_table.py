@@ -0,0 +1,157 @@
+# Thread-safe HashTables.
+# LockedHashTable guards one HashTable with a single lock; StripedHashTable splits the keys
+# over independent segments, each with its own lock, so threads touching different
+# segments never wait on each other.
+
+import threading
+from collections.abc import MutableMapping
+
+from hash_table import MASK64, HashTable
+
+SEGMENT_MIX = 0xC2B2AE3D27D4EB4F       # differs from FIB, so segment choice and slot choice stay independent
+
+
+class LockedHashTable(MutableMapping):
+    """HashTable behind one global lock"""
+
+    def __init__(self, **options):
+        self.table = HashTable(**options)
+        self.lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self.lock:
+            return self.table[key]
+
+    def get(self, key, default=None):
+        with self.lock:
+            return self.table.get(key, default)
+
+    def __setitem__(self, key, val):
+        with self.lock:
+            self.table[key] = val
+
+    def __delitem__(self, key):
+        with self.lock:
+            del self.table[key]
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.table
+
+    def __len__(self):
+        return len(self.table)
+
+    def clear(self):
+        with self.lock:
+            self.table.clear()
+
+    def __iter__(self):
+        with self.lock:
+            keys = list(self.table)  # snapshot, so other threads can keep writing
+        return iter(keys)
+
+
+class StripedHashTable(MutableMapping):
+    """Lock striping: 2**k segments, each a HashTable with its own lock.
+    Options other than segments are passed to every segment's HashTable."""
+
+    def __init__(self, segments=16, **options):
+        self.segments = 1 << max(segments - 1, 0).bit_length()   # power of two >= segments
+        self.seg_bits = self.segments.bit_length() - 1
+        self.tables = [HashTable(**options) for _ in range(self.segments)]
+        self.locks = [threading.Lock() for _ in range(self.segments)]
+
+    def _segment(self, key):
+        """Segment number for key, from the top bits of a second mix of its hash"""
+        return ((hash(key) * SEGMENT_MIX) & MASK64) >> (64 - self.seg_bits)
+
+    def __getitem__(self, key):
+        i = self._segment(key)
+        with self.locks[i]:
+            return self.tables[i][key]
+
+    def get(self, key, default=None):
+        i = self._segment(key)
+        with self.locks[i]:
+            return self.tables[i].get(key, default)
+
+    def __setitem__(self, key, val):
+        i = self._segment(key)
+        with self.locks[i]:
+            self.tables[i][key] = val
+
+    def __delitem__(self, key):
+        i = self._segment(key)
+        with self.locks[i]:
+            del self.tables[i][key]
+
+    def __contains__(self, key):
+        i = self._segment(key)
+        with self.locks[i]:
+            return key in self.tables[i]
+
+    def setdefault(self, key, default=None):
+        """Atomic: only one thread can insert key"""
+        i = self._segment(key)
+        with self.locks[i]:
+            table = self.tables[i]
+            if key not in table:
+                table[key] = default
+            return table[key]
+
+    def pop(self, key, *default):
+        """Atomic remove-and-return"""
+        i = self._segment(key)
+        with self.locks[i]:
+            return self.tables[i].pop(key, *default)
+
+    def clear(self):
+        """Clears one segment at a time, each under its own lock"""
+        for table, lock in zip(self.tables, self.locks):
+            with lock:
+                table.clear()
+
+    def __len__(self):
+        """Sum of segment counts; may be momentarily stale while writers are active"""
+        return sum(table.count for table in self.tables)
+
+    def __iter__(self):
+        """Keys, snapshotting one segment at a time (never holds more than one lock)"""
+        for table, lock in zip(self.tables, self.locks):
+            with lock:
+                keys = list(table)
+            yield from keys
+
+
+def throughput(table, threads, ops_per_thread=20000, key_space=10000):
+    """Operations per second for threads doing 80% reads / 20% writes on random keys"""
+    import random
+    import time
+
+    for i in range(key_space):
+        table[i] = i
+
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(ops_per_thread):
+            key = rng.randrange(key_space)
+            if rng.random() < 0.8:
+                table.get(key)
+            else:
+                table[key] = seed
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return threads * ops_per_thread / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(f"{'threads':>7} {'one lock ops/s':>15} {'striped ops/s':>15}")
+    for threads in (1, 2, 4, 8, 16):
+        locked = throughput(LockedHashTable(), threads)
+        striped = throughput(StripedHashTable(segments=16), threads)
+        print(f"{threads:7} {locked:15.0f} {striped:15.0f}")
@@ -1,60 +1,450 @@
-class HashTable:
-    def __init__(self):
-        self.MAX = 10                      # fixed size of hash table
-        self.arr = [None for _ in range(self.MAX)]  # initialize with empty slots
+from array import array
+from collections.abc import ItemsView, MutableMapping, ValuesView
+
+FNV_OFFSET = 0xcbf29ce484222325        # 64-bit FNV-1a parameters
+FNV_PRIME = 0x100000001b3
+MASK64 = 0xFFFFFFFFFFFFFFFF
+FIB = 0x9E3779B97F4A7C15               # 2**64 / golden ratio, spreads hash bits over the table
+
+
+def key_to_bytes(key):
+    """Byte form of a key for the byte-oriented hash functions.
+    Equal keys give equal bytes (1, 1.0 and True all map alike)."""
+    if isinstance(key, str):
+        return key.encode("utf-8")
+    if isinstance(key, (bytes, bytearray)):
+        return bytes(key)
+    # Everything else goes through the builtin hash, which agrees across equal ints, floats
+    # and bools; int hashes aren't randomised per process, so the bytes stay stable
+    return (hash(key) & MASK64).to_bytes(8, "little")
+
+
+def ascii_hash(key):
+    """Original hash: sum of character codes (anagrams collide)"""
+    return sum(key_to_bytes(key))
+
+
+def fnv1a_hash(key):
+    """64-bit FNV-1a: stable across processes, unlike the builtin hash"""
+    h = FNV_OFFSET
+    for byte in key_to_bytes(key):
+        h = ((h ^ byte) * FNV_PRIME) & MASK64
+    return h
+
+
+# Storage follows CPython's compact dict: a dense table of entries
+# (separate key / value / hash columns, in insertion order) and a small
+# index array of slots that point into it.
+EMPTY = -1                             # index slot never used
+DUMMY = -2                             # index slot of a deleted entry (tombstone), keep probing past it
+DELETED = object()                     # key column marker for a deleted entry (a hole)
+
+# How colliding keys are placed:
+#   linear     next slot, h + 1, h + 2, ...
+#   quadratic  triangular steps, h + 1, h + 3, h + 6, ... (visits every slot of a power-of-two table)
+#   double     fixed odd step taken from other bits of the hash
+#   robinhood  linear, but a key far from home evicts one closer to home; no tombstones
+#   chaining   every slot heads a linked chain of entries (via the links column)
+COLLISION_STRATEGIES = ("linear", "quadratic", "double", "robinhood", "chaining")
+
+HASH_FUNCTIONS = {
+    "builtin": hash,       # SipHash for str/bytes, fastest in CPython
+    "fnv1a": fnv1a_hash,
+    "ascii": ascii_hash,
+}
+
+
+def index_typecode(limit):
+    """Smallest signed array typecode that can hold entry numbers below limit"""
+    for code in ("b", "h", "i", "q"):
+        if limit < 2 ** (8 * array(code).itemsize - 1):
+            return code
+
+
+class _Items(ItemsView):
+    """items() view that walks the entry columns instead of looking every key up again"""
+    def __iter__(self):
+        yield from self._mapping._items()
+
+
+class _Values(ValuesView):
+    """values() view that walks the entry columns"""
+    def __iter__(self):
+        for _, val in self._mapping._items():
+            yield val
+
+
+class HashTable(MutableMapping):
+    """dict-like mapping; works anywhere a MutableMapping is accepted"""
+
+    def __init__(self, size=8, max_load=0.75, min_load=0.0, hash_func="builtin",
+                 max_tombstones=0.25, collision="linear"):
+        if not 0 < max_load < 1 or not 0 <= min_load * 2 < max_load:
+            raise ValueError("need 0 <= 2 * min_load < max_load < 1")
+        if not 0 < max_tombstones < 1:
+            raise ValueError("need 0 < max_tombstones < 1")
+        if collision not in COLLISION_STRATEGIES:
+            raise ValueError(f"collision must be one of {COLLISION_STRATEGIES}")
+        self.hash_func = HASH_FUNCTIONS.get(hash_func, hash_func)  # name or any callable
+        if not callable(self.hash_func):
+            raise ValueError(f"hash_func must be one of {tuple(HASH_FUNCTIONS)} or a callable")
+        self.collision = collision
+        self.step_growth = 1 if collision == "quadratic" else 0
+        self.count = 0                     # number of stored keys
+        self.max_load = max_load           # grow when count / MAX goes above this
+        self.min_load = min_load           # shrink when count / MAX goes below this (0 disables)
+        self.tombstones = 0                # index slots marked DUMMY
+        self.holes = 0                     # entries marked DELETED
+        self.max_tombstones = max_tombstones  # compact when holes / MAX goes above this
+
+        # Dense entries, one column per field; no (key, val) tuple per insert
+        self.entry_keys = []
+        self.entry_values = []
+        self.entry_hashes = array("Q")     # mixed 64-bit hash, so resizing never rehashes keys
+        self.entry_links = array("q")      # chaining only: next entry in the same chain
+
+        self._build_index(self._round_up(size))  # sets MAX, bits and indices
+        self.min_size = self.MAX           # never shrink below the initial size
+
+    @staticmethod
+    def _round_up(size):
+        """Smallest power of two >= size (at least 8)"""
+        n = 8
+        while n < size:
+            n *= 2
+        return n
+
+    def _mix(self, key):
+        """Full 64-bit hash of key; Fibonacci hashing (hash * FIB) spreads
+        keys whose hashes differ only slightly across the whole table"""
+        return (self.hash_func(key) * FIB) & MASK64
+
+    def _start(self, mixed):
+        """(home slot, first step) of the probe sequence for a mixed hash"""
+        h = mixed >> (64 - self.bits)
+        if self.collision == "double":
+            return h, ((mixed >> 32) % self.MAX) | 1  # odd step reaches every slot
+        return h, 1
 
     def get_hash(self, key):
-        """Simple hash function: sum of ASCII values mod table size"""
-        h = 0
-        for char in key:
-            h += ord(char)
-        return h % self.MAX
+        """Home slot for key"""
+        return self._mix(key) >> (64 - self.bits)
 
-    def __setitem__(self, key, val):
-        """Insert key-value using linear probing"""
-        h = self.get_hash(key)
+    def probe_length(self, key):
+        """Number of slots (or chain entries) inspected to find key, or to prove it is absent"""
+        if self.collision == "chaining":
+            return self._find_chained(key, self._mix(key))[2]
+        return self._find(key, self._mix(key))[1]
+
+    def _distance(self, slot):
+        """How far the entry in slot sits from its home slot (Robin Hood)"""
+        return (slot - (self.entry_hashes[self.indices[slot]] >> (64 - self.bits))) % self.MAX
+
+    def _find(self, key, mixed):
+        """(slot, probes) for key in an open-addressing table; slot is -1 when key is absent.
+        Tombstones are skipped, only a truly empty slot ends the chain."""
+        indices, keys, hashes = self.indices, self.entry_keys, self.entry_hashes
+        h, step = self._start(mixed)
+        probes = 1
+        while indices[h] != EMPTY:
+            ix = indices[h]
+            if ix != DUMMY:
+                # Comparing the stored hash first skips most key comparisons
+                if hashes[ix] == mixed and keys[ix] == key:
+                    return h, probes
+                # Robin Hood: key would have evicted anything closer to home than itself
+                if self.collision == "robinhood" and self._distance(h) < probes - 1:
+                    break
+            h = (h + step) % self.MAX
+            step += self.step_growth
+            probes += 1
+        return -1, probes
+
+    def _find_chained(self, key, mixed):
+        """(entry, previous entry, probes) for key in a chaining table; entry is -1 when absent"""
+        keys, hashes = self.entry_keys, self.entry_hashes
+        ix, prev = self.indices[mixed >> (64 - self.bits)], -1
+        probes = 1
+        while ix != EMPTY:
+            if hashes[ix] == mixed and keys[ix] == key:
+                return ix, prev, probes
+            prev, ix = ix, self.entry_links[ix]
+            probes += 1
+        return -1, prev, probes
 
-        # If slot is empty or key already exists → store value
-        if self.arr[h] is None or self.arr[h][0] == key:
-            self.arr[h] = (key, val)
+    def _entry(self, key, mixed):
+        """Entry number of key, or -1"""
+        if self.collision == "chaining":
+            return self._find_chained(key, mixed)[0]
+        slot = self._find(key, mixed)[0]
+        return -1 if slot == -1 else self.indices[slot]
+
+    def _append(self, key, val, mixed):
+        """Add a new entry to the dense columns; returns its number"""
+        self.entry_keys.append(key)
+        self.entry_values.append(val)
+        self.entry_hashes.append(mixed)
+        if self.collision == "chaining":
+            self.entry_links.append(EMPTY)
+        return len(self.entry_keys) - 1
+
+    def _place(self, ix):
+        """Link entry ix into the index (table must have an empty slot and not contain its key)"""
+        indices = self.indices
+        h, step = self._start(self.entry_hashes[ix])
+        if self.collision == "chaining":
+            self.entry_links[ix] = indices[h]  # push onto the front of the chain
+            indices[h] = ix
+        elif self.collision == "robinhood":
+            dist = 0
+            while indices[h] != EMPTY:
+                # Swap with the richer entry (closer to home) and carry it onwards
+                other = self._distance(h)
+                if other < dist:
+                    ix, indices[h] = indices[h], ix
+                    dist = other
+                h = (h + 1) % self.MAX
+                dist += 1
+            indices[h] = ix
+        else:
+            while indices[h] != EMPTY:
+                h = (h + step) % self.MAX
+                step += self.step_growth
+            indices[h] = ix
+
+    def _insert(self, key, val, mixed):
+        """Store key → val without resizing; True if key was new"""
+        if self.collision in ("chaining", "robinhood"):
+            ix = self._entry(key, mixed)
+            if ix != -1:
+                self.entry_values[ix] = val
+                return False
+            self._place(self._append(key, val, mixed))
+            return True
+
+        indices, keys, hashes = self.indices, self.entry_keys, self.entry_hashes
+        h, step = self._start(mixed)
+        free = -1  # first tombstone seen, reused if key is new
+
+        # Walk the chain until an empty slot; update in place if key already exists
+        while indices[h] != EMPTY:
+            ix = indices[h]
+            if ix == DUMMY:
+                if free == -1:
+                    free = h
+            elif hashes[ix] == mixed and keys[ix] == key:
+                self.entry_values[ix] = val
+                return False
+            h = (h + step) % self.MAX  # Collision → probe the next slot
+            step += self.step_growth
+
+        if free != -1:
+            h = free
+            self.tombstones -= 1
+        indices[h] = self._append(key, val, mixed)
+        return True
+
+    def _items(self):
+        """All stored (key, val) pairs, in insertion order"""
+        for key, val in zip(self.entry_keys, self.entry_values):
+            if key is not DELETED:
+                yield key, val
+
+    def _build_index(self, size):
+        """Fresh index of size slots, with every live entry linked in"""
+        self.MAX = size
+        self.bits = self.MAX.bit_length() - 1
+        # Entry numbers stay below 2 * MAX: live entries are capped by max_load, holes by max_tombstones
+        self.indices = array(index_typecode(2 * self.MAX), [EMPTY]) * self.MAX
+        self.tombstones = 0
+        for ix in range(len(self.entry_keys)):
+            self._place(ix)
+
+    def _resize(self, new_size):
+        """Drop deleted entries, then re-link everything into new_size slots using the stored hashes"""
+        if self.holes:
+            live = [ix for ix, key in enumerate(self.entry_keys) if key is not DELETED]
+            self.entry_keys = [self.entry_keys[ix] for ix in live]
+            self.entry_values = [self.entry_values[ix] for ix in live]
+            self.entry_hashes = array("Q", [self.entry_hashes[ix] for ix in live])
+            if self.collision == "chaining":
+                self.entry_links = array("q", [EMPTY]) * len(live)
+            self.holes = 0
+        self._build_index(new_size)
+
+    def __setitem__(self, key, val):
+        """Insert key-value, resolving collisions with the table's strategy (amortized O(1))"""
+        if not self._insert(key, val, self._mix(key)):
             return
+        self.count += 1
 
-        # Collision → Linear Probing
-        start = h
-        while True:
-            h = (h + 1) % self.MAX
-            if self.arr[h] is None or self.arr[h][0] == key:
-                self.arr[h] = (key, val)
-                return
-            if h == start:  # we circled back → table full
-                raise Exception("HashTable is full!")
+        # Keep live + deleted slots under max_load so probing always finds an empty slot
+        if self.count > self.max_load * self.MAX:
+            self._resize(self.MAX * 2)
+        elif self.count + self.tombstones > self.max_load * self.MAX:
+            self._resize(self.MAX)  # mostly tombstones → compact in place
 
     def __getitem__(self, key):
-        """Retrieve value for key using linear probing"""
-        h = self.get_hash(key)
-        start = h
-        while self.arr[h] is not None:
-            if self.arr[h][0] == key:
-                return self.arr[h][1]
-            h = (h + 1) % self.MAX
-            if h == start:  # circled back
-                break
-        return None  # key not found
+        """Retrieve value for key"""
+        ix = self._entry(key, self._mix(key))
+        if ix == -1:
+            raise KeyError(f"{key} not found")
+        return self.entry_values[ix]
+
+    def get(self, key, default=None):
+        """Value for key, or default when it is absent (a stored None stays distinguishable)"""
+        ix = self._entry(key, self._mix(key))
+        return default if ix == -1 else self.entry_values[ix]
+
+    def __contains__(self, key):
+        return self._entry(key, self._mix(key)) != -1
+
+    def __len__(self):
+        """O(1): the count is kept up to date by every insert and delete"""
+        return self.count
+
+    def __iter__(self):
+        """Keys in insertion order, produced lazily"""
+        count = self.count
+        for key, _ in self._items():
+            yield key
+            if self.count != count:
+                raise RuntimeError("HashTable changed size during iteration")
+
+    def items(self):
+        return _Items(self)
+
+    def values(self):
+        return _Values(self)
+
+    def clear(self):
+        """Remove everything, back to the initial size"""
+        self.entry_keys, self.entry_values = [], []
+        self.entry_hashes, self.entry_links = array("Q"), array("q")
+        self.count = self.holes = 0
+        self._build_index(self.min_size)
+
+    def __repr__(self):
+        return f"HashTable({{{', '.join(f'{key!r}: {val!r}' for key, val in self._items())}}})"
+
+    def _reserve(self, extra):
+        """Grow once so that extra more keys fit under max_load, instead of doubling repeatedly"""
+        needed = self.count + self.tombstones + extra
+        if needed > self.max_load * self.MAX:
+            size = self._round_up(int(needed / self.max_load) + 1)
+            self._resize(max(size, self.MAX))
+
+    def set_many(self, pairs):
+        """Insert many (key, val) pairs: the table is sized once up front and
+        all keys are hashed in one pass before any probing"""
+        if not isinstance(pairs, (list, tuple)):
+            pairs = list(pairs)
+        self._reserve(len(pairs))
+        hashes = list(map(self._mix, [key for key, _ in pairs]))
+        insert = self._insert
+        added = 0
+        for (key, val), mixed in zip(pairs, hashes):
+            added += insert(key, val, mixed)
+        self.count += added
+
+    def update(self, other=(), **kwargs):
+        """Like dict.update: other may be a mapping or an iterable of (key, val) pairs"""
+        if hasattr(other, "keys"):
+            other = [(key, other[key]) for key in other.keys()]
+        self.set_many(other)
+        if kwargs:
+            self.set_many(kwargs.items())
+
+    def get_many(self, keys, default=None):
+        """List of values for keys, default for missing ones"""
+        if not isinstance(keys, (list, tuple)):
+            keys = list(keys)
+        values, entry = self.entry_values, self._entry
+        result = []
+        for key, mixed in zip(keys, map(self._mix, keys)):
+            ix = entry(key, mixed)
+            result.append(default if ix == -1 else values[ix])
+        return result
 
     def __delitem__(self, key):
         """Delete key-value pair"""
-        h = self.get_hash(key)
-        start = h
-        while self.arr[h] is not None:
-            if self.arr[h][0] == key:
-                self.arr[h] = None
-                return
-            h = (h + 1) % self.MAX
-            if h == start:
-                break
-        raise KeyError(f"{key} not found")
+        mixed = self._mix(key)
+        if self.collision == "chaining":
+            ix, prev, _ = self._find_chained(key, mixed)
+            if ix == -1:
+                raise KeyError(f"{key} not found")
+            if prev == -1:
+                self.indices[mixed >> (64 - self.bits)] = self.entry_links[ix]
+            else:
+                self.entry_links[prev] = self.entry_links[ix]
+        else:
+            h = self._find(key, mixed)[0]
+            if h == -1:
+                raise KeyError(f"{key} not found")
+            ix = self.indices[h]
+            if self.collision == "robinhood":
+                self._shift_back(h)
+            else:
+                # Leave a tombstone so later keys in the chain stay reachable
+                self.indices[h] = DUMMY
+                self.tombstones += 1
+
+        # The entry becomes a hole until the next resize compacts the columns
+        self.entry_keys[ix] = DELETED
+        self.entry_values[ix] = None
+        self.holes += 1
+        self.count -= 1
+
+        # Halve the table when it gets too sparse, compact it when holes pile up
+        if self.MAX > self.min_size and self.count < self.min_load * self.MAX:
+            self._resize(self.MAX // 2)
+        elif self.holes > self.max_tombstones * self.MAX:
+            self._resize(self.MAX)
+
+    def popitem(self):
+        """Remove and return the last inserted (key, val) pair (LIFO, like dict).
+        Overridden because MutableMapping's version restarts iteration, walking past
+        every leading hole, on each call."""
+        self._trim_holes()
+        if not self.entry_keys:
+            raise KeyError("popitem(): table is empty")
+        key, val = self.entry_keys[-1], self.entry_values[-1]
+        del self[key]
+        self._trim_holes()
+        return key, val
+
+    def _trim_holes(self):
+        """Drop deleted entries from the end of the columns; nothing in the index points at them"""
+        keys = self.entry_keys
+        while keys and keys[-1] is DELETED:
+            keys.pop()
+            self.entry_values.pop()
+            self.entry_hashes.pop()
+            if self.collision == "chaining":
+                self.entry_links.pop()
+            self.holes -= 1
+
+    def _shift_back(self, h):
+        """Robin Hood delete: pull following displaced entries back one slot instead of a tombstone"""
+        indices = self.indices
+        nxt = (h + 1) % self.MAX
+        while indices[nxt] != EMPTY and self._distance(nxt) > 0:
+            indices[h] = indices[nxt]
+            h, nxt = nxt, (nxt + 1) % self.MAX
+        indices[h] = EMPTY
 
     def print_table(self):
         """Helper method to display table"""
-        for i, val in enumerate(self.arr):
-            print(i, ":", val)
+        for i, ix in enumerate(self.indices):
+            if ix == EMPTY:
+                print(i, ":", None)
+            elif ix == DUMMY:
+                print(i, ":", "<deleted>")
+            elif self.collision == "chaining":
+                chain = []
+                while ix != EMPTY:
+                    chain.append((self.entry_keys[ix], self.entry_values[ix]))
+                    ix = self.entry_links[ix]
+                print(i, ":", chain)
+            else:
+                print(i, ":", (self.entry_keys[ix], self.entry_values[ix]))
@@ -0,0 +1,183 @@
+# Benchmarks for HashTable
+# Run from this folder: python hash_table_benchmark.py
+
+import io
+import time
+import tracemalloc
+from collections import Counter
+
+from hash_table import COLLISION_STRATEGIES, HashTable
+
+
+def stock_style_keys(n):
+    """Keys shaped like stock_prices.csv: 'march 6', 'march 7', ..."""
+    months = ["january", "february", "march", "april", "may", "june",
+              "july", "august", "september", "october", "november", "december"]
+    keys = []
+    year = 2000
+    while len(keys) < n:
+        for month in months:
+            for day in range(1, 32):
+                keys.append(f"{month} {day} {year}")
+        year += 1
+    return keys[:n]
+
+
+def probe_distribution(hash_func, keys):
+    """Histogram of probe lengths for every stored key, plus insert time"""
+    table = HashTable(hash_func=hash_func)
+    start = time.perf_counter()
+    for i, key in enumerate(keys):
+        table[key] = i
+    elapsed = time.perf_counter() - start
+    return Counter(table.probe_length(key) for key in keys), elapsed
+
+
+def print_distribution(name, lengths, elapsed):
+    total = sum(lengths.values())
+    mean = sum(length * n for length, n in lengths.items()) / total
+    print(f"{name:8} mean={mean:7.2f}  max={max(lengths):6}  insert={elapsed:.3f}s")
+    for bucket in (1, 2, 3, 5, 10, 100, 1000):
+        share = sum(n for length, n in lengths.items() if length <= bucket) / total
+        print(f"    <= {bucket:4} probes: {share:6.1%}")
+
+
+def strategy_at_load(collision, load, size=2 ** 14):
+    """Fill a fixed-size table to the given load factor; return
+    (inserts/s, lookups/s, worst lookup in microseconds, worst probe length)"""
+    n = int(size * load)
+    keys = stock_style_keys(n)
+    table = HashTable(size=size, max_load=min(load + 0.01, 0.99), collision=collision)
+
+    start = time.perf_counter()
+    for i, key in enumerate(keys):
+        table[key] = i
+    insert_rate = n / (time.perf_counter() - start)
+
+    worst = 0
+    start = time.perf_counter()
+    for key in keys:
+        t0 = time.perf_counter_ns()
+        table[key]
+        worst = max(worst, time.perf_counter_ns() - t0)
+    lookup_rate = n / (time.perf_counter() - start)
+
+    worst_probes = max(table.probe_length(key) for key in keys)
+    return insert_rate, lookup_rate, worst / 1000, worst_probes
+
+
+def bytes_per_entry(n):
+    """Memory traced while storing n prebuilt keys/values: the old layout
+    (a slot list of (key, val) tuples, sized like the table) vs HashTable"""
+    keys = [f"key {i}" for i in range(n)]
+    values = list(range(n))
+    results = {}
+
+    tracemalloc.start()
+    table = HashTable()
+    for key, val in zip(keys, values):
+        table[key] = val
+    results["compact"] = tracemalloc.get_traced_memory()[0] / n
+    del table
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    size = HashTable._round_up(n / 0.75)
+    slots = [None] * size
+    for i, (key, val) in enumerate(zip(keys, values)):
+        slots[i] = (key, val)  # placement doesn't change the memory used
+    results["tuples"] = tracemalloc.get_traced_memory()[0] / n
+    del slots
+    tracemalloc.stop()
+    return results
+
+
+def csv_ingest(rows):
+    """Load a 'day,temp' CSV like nyc_weather.csv row by row vs with HashTable.update;
+    returns (row-by-row seconds, bulk seconds)"""
+    text = "date,temperature(F)\n" + "".join(f"day {i},{i % 100}\n" for i in range(rows))
+
+    start = time.perf_counter()
+    temps = HashTable()
+    file = io.StringIO(text)
+    next(file)
+    for line in file:
+        day, temp = line.strip().split(',')
+        temps[day] = int(temp)
+    one_by_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    temps = HashTable()
+    file = io.StringIO(text)
+    next(file)
+    temps.update((day, int(temp)) for day, temp in (line.strip().split(',') for line in file))
+    bulk = time.perf_counter() - start
+    return one_by_one, bulk
+
+
+def versus_dict(n):
+    """Seconds for insert / lookup / `in` / iterate over n keys, dict vs HashTable"""
+    keys = [f"key {i}" for i in range(n)]
+    results = {}
+    for name, factory in (("dict", dict), ("HashTable", HashTable)):
+        table = factory()
+        timings = []
+        start = time.perf_counter()
+        for i, key in enumerate(keys):
+            table[key] = i
+        timings.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for key in keys:
+            table[key]
+        timings.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for key in keys:
+            key in table
+        timings.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for _ in table.items():
+            pass
+        timings.append(time.perf_counter() - start)
+        results[name] = timings
+    return results
+
+
+if __name__ == "__main__":
+    keys = stock_style_keys(5000)
+    print(f"Probe lengths for {len(keys)} keys like 'march 6 2000'")
+    for name in ("ascii", "fnv1a", "builtin"):
+        lengths, elapsed = probe_distribution(name, keys)
+        print_distribution(name, lengths, elapsed)
+
+    print()
+    print("Collision strategies on a 16384-slot table")
+    print(f"{'strategy':10} {'load':>5} {'insert/s':>10} {'lookup/s':>10} {'worst us':>9} {'worst probes':>13}")
+    for load in (0.5, 0.75, 0.9):
+        for collision in COLLISION_STRATEGIES:
+            insert_rate, lookup_rate, worst_us, worst_probes = strategy_at_load(collision, load)
+            print(f"{collision:10} {load:5.2f} {insert_rate:10.0f} {lookup_rate:10.0f} "
+                  f"{worst_us:9.1f} {worst_probes:13}")
+
+    print()
+    n = 10 ** 6
+    memory = bytes_per_entry(n)
+    print(f"Bytes per entry at {n} keys (keys and values themselves excluded)")
+    print(f"    (key, val) tuple slots: {memory['tuples']:6.1f}")
+    print(f"    compact columns + index: {memory['compact']:6.1f}")
+
+    print()
+    one_by_one, bulk = csv_ingest(10 ** 6)
+    print(f"Ingest 10^6 CSV rows: row by row {one_by_one:.2f}s, update() {bulk:.2f}s")
+
+    print()
+    print("dict vs HashTable, 10^5 keys (seconds)")
+    print(f"{'':10} {'insert':>8} {'lookup':>8} {'in':>8} {'items':>8}")
+    for name, timings in versus_dict(10 ** 5).items():
+        print(f"{name:10} " + " ".join(f"{t:8.4f}" for t in timings))
+
+    # Non-string keys work with every hash function
+    table = HashTable(hash_func="fnv1a")
+    table[42] = "int"
+    table[("march", 6)] = "tuple"
+    table[b"raw"] = "bytes"
+    print(table[42], table[("march", 6)], table[b"raw"])
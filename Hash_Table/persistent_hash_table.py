@@ -0,0 +1,237 @@
+# File-backed HashTable: open addressing over fixed-width slots in a memory-mapped file.
+# Opening an existing table only maps the file, and a lookup pages in just the slots it probes,
+# so a multi-GB index is usable right after a restart without re-inserting anything.
+
+import mmap
+import os
+import struct
+from collections.abc import MutableMapping
+
+from hash_table import FIB, MASK64, HashTable, fnv1a_hash
+
+MAGIC = b"PHTABLE1"
+HEADER = struct.Struct("<8sIIQQQ")     # magic, key_size, value_size, capacity, count, tombstones
+SLOT = struct.Struct("<BQHH")          # state, hash, key length, value length; key and value bytes follow
+
+EMPTY, USED, DELETED = 0, 1, 2         # slot states
+
+# Values carry a one-byte type tag so they come back as the type that was stored
+VALUE_TYPES = {
+    b"b": (bytes, lambda v: v, lambda b: b),
+    b"s": (str, lambda v: v.encode("utf-8"), lambda b: b.decode("utf-8")),
+    b"i": (int, lambda v: struct.pack("<q", v), lambda b: struct.unpack("<q", b)[0]),
+    b"f": (float, lambda v: struct.pack("<d", v), lambda b: struct.unpack("<d", b)[0]),
+}
+
+
+def encode_key(key):
+    """Keys are str (stored as UTF-8) or bytes"""
+    if isinstance(key, str):
+        return b"s" + key.encode("utf-8")
+    if isinstance(key, (bytes, bytearray)):
+        return b"b" + bytes(key)
+    raise TypeError(f"keys must be str or bytes, not {type(key).__name__}")
+
+
+def decode_key(data):
+    return data[1:].decode("utf-8") if data[:1] == b"s" else data[1:]
+
+
+def encode_value(val):
+    for tag, (kind, encode, _) in VALUE_TYPES.items():
+        if type(val) is kind:
+            return tag + encode(val)
+    raise TypeError(f"values must be bytes, str, int or float, not {type(val).__name__}")
+
+
+def decode_value(data):
+    return VALUE_TYPES[data[:1]][2](data[1:])
+
+
+class PersistentHashTable(MutableMapping):
+    """Linear-probing hash table stored in a file.
+
+    key_size / value_size are the maximum encoded sizes (one tag byte included);
+    they and the capacity are only used when the file is created, an existing
+    file keeps its own. The table doubles (rewriting the file) when more than
+    max_load of the slots are used or deleted.
+    """
+
+    def __init__(self, path, capacity=1024, key_size=32, value_size=16, max_load=0.75):
+        if not 0 < max_load < 1:
+            raise ValueError("need 0 < max_load < 1")  # a full table leaves probing no empty slot to stop on
+        self.path = path
+        self.max_load = max_load
+        if not os.path.exists(path):
+            self._create(path, HashTable._round_up(capacity), key_size, value_size)
+        self._open()
+
+    @staticmethod
+    def _create(path, capacity, key_size, value_size):
+        """Write a header and an all-empty slot area (sparse on most filesystems, so this is instant)"""
+        slot_size = SLOT.size + key_size + value_size
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, key_size, value_size, capacity, 0, 0))
+            f.truncate(HEADER.size + capacity * slot_size)
+
+    def _open(self):
+        self.file = open(self.path, "r+b")
+        self.mm = mmap.mmap(self.file.fileno(), 0)
+        magic, self.key_size, self.value_size, self.MAX, self.count, self.tombstones = \
+            HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a PersistentHashTable file")
+        self.bits = self.MAX.bit_length() - 1
+        self.slot_size = SLOT.size + self.key_size + self.value_size
+
+    def _write_header(self):
+        HEADER.pack_into(self.mm, 0, MAGIC, self.key_size, self.value_size,
+                         self.MAX, self.count, self.tombstones)
+
+    def _offset(self, slot):
+        return HEADER.size + slot * self.slot_size
+
+    def _find(self, data, h):
+        """(slot, first free slot) for encoded key data with hash h; slot is -1 when absent"""
+        mm = self.mm
+        slot = ((h * FIB) & MASK64) >> (64 - self.bits)
+        free = -1
+        for _ in range(self.MAX):  # at most one lap, even if no slot is empty
+            off = self._offset(slot)
+            state, stored_hash, key_len, _ = SLOT.unpack_from(mm, off)
+            if state == EMPTY:
+                return -1, slot if free == -1 else free
+            if state == DELETED:
+                if free == -1:
+                    free = slot
+            elif stored_hash == h and mm[off + SLOT.size:off + SLOT.size + key_len] == data:
+                return slot, free
+            slot = (slot + 1) % self.MAX
+        return -1, free
+
+    def __getitem__(self, key):
+        data = encode_key(key)
+        slot = self._find(data, fnv1a_hash(data))[0]
+        if slot == -1:
+            raise KeyError(f"{key} not found")
+        off = self._offset(slot)
+        value_len = SLOT.unpack_from(self.mm, off)[3]
+        start = off + SLOT.size + self.key_size
+        return decode_value(self.mm[start:start + value_len])
+
+    def __contains__(self, key):
+        data = encode_key(key)
+        return self._find(data, fnv1a_hash(data))[0] != -1
+
+    def _write_slot(self, slot, h, data, value):
+        off = self._offset(slot)
+        SLOT.pack_into(self.mm, off, USED, h, len(data), len(value))
+        self.mm[off + SLOT.size:off + SLOT.size + len(data)] = data
+        start = off + SLOT.size + self.key_size
+        self.mm[start:start + len(value)] = value
+
+    def __setitem__(self, key, val):
+        data, value = encode_key(key), encode_value(val)
+        if len(data) > self.key_size or len(value) > self.value_size:
+            raise ValueError(f"key or value for {key!r} is wider than its fixed-width slot")
+        h = fnv1a_hash(data)
+        slot, free = self._find(data, h)
+        if slot != -1:
+            self._write_slot(slot, h, data, value)  # overwrite the value in place
+            return
+
+        if SLOT.unpack_from(self.mm, self._offset(free))[0] == DELETED:
+            self.tombstones -= 1
+        self._write_slot(free, h, data, value)
+        self.count += 1
+        self._write_header()
+        if self.count > self.max_load * self.MAX:
+            self._resize(self.MAX * 2)
+        elif self.count + self.tombstones > self.max_load * self.MAX:
+            self._resize(self.MAX)  # mostly tombstones → compact
+
+    def __delitem__(self, key):
+        data = encode_key(key)
+        slot = self._find(data, fnv1a_hash(data))[0]
+        if slot == -1:
+            raise KeyError(f"{key} not found")
+        self.mm[self._offset(slot)] = DELETED  # tombstone, keeps later keys in the chain reachable
+        self.count -= 1
+        self.tombstones += 1
+        self._write_header()
+
+    def __len__(self):
+        return self.count
+
+    def _slots(self):
+        """(offset, key length, value length) of every used slot"""
+        for slot in range(self.MAX):
+            off = self._offset(slot)
+            state, _, key_len, value_len = SLOT.unpack_from(self.mm, off)
+            if state == USED:
+                yield off, key_len, value_len
+
+    def __iter__(self):
+        for off, key_len, _ in self._slots():
+            yield decode_key(self.mm[off + SLOT.size:off + SLOT.size + key_len])
+
+    def _resize(self, new_size):
+        """Rehash into a new file next to this one, then swap it in atomically"""
+        tmp_path = self.path + ".resize"
+        self._create(tmp_path, new_size, self.key_size, self.value_size)
+        bigger = PersistentHashTable(tmp_path)
+        for off, key_len, value_len in self._slots():
+            h = SLOT.unpack_from(self.mm, off)[1]
+            data = self.mm[off + SLOT.size:off + SLOT.size + key_len]
+            start = off + SLOT.size + self.key_size
+            slot = bigger._find(data, h)[1]
+            bigger._write_slot(slot, h, data, self.mm[start:start + value_len])
+        bigger.count = self.count
+        bigger._write_header()
+        bigger.close()
+        self.close()
+        os.replace(tmp_path, self.path)
+        self._open()
+
+    def flush(self):
+        """Push dirty pages to disk"""
+        self.mm.flush()
+
+    def close(self):
+        if not self.mm.closed:
+            self.mm.flush()
+            self.mm.close()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    path = os.path.join(tempfile.mkdtemp(), "stock_prices.pht")
+
+    # First run: parse the CSV once and persist symbol → price
+    with PersistentHashTable(path) as prices:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "stock_prices.csv")) as f:
+            for line in f:
+                day, price = line.split(',')
+                prices[day] = float(price)
+
+    # Later runs: just reopen the file
+    start = time.perf_counter()
+    with PersistentHashTable(path) as prices:
+        opened = time.perf_counter() - start
+        print(f"Reopened {len(prices)} prices in {opened * 1000:.2f} ms")
+        print("march 9:", prices["march 9"])
+
+    # Growth past the initial capacity
+    with PersistentHashTable(path) as prices:
+        for i in range(5000):
+            prices[f"day {i}"] = i
+        print(len(prices), prices["day 4999"], prices.MAX)
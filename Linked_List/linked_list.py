@@ -1,5 +1,10 @@
+import sys
+
+
 # Node represents each element in the linked list
 class Node:
+    __slots__ = ("data", "next")   # no per-node __dict__, much smaller nodes
+
     def __init__(self, data, next):
         self.data = data   # stores the value
         self.next = next   # pointer to the next node
@@ -9,33 +14,40 @@ class Node:
 class LinkedList:
     def __init__(self):
         self.head = None   # initially list is empty
+        self.tail = None   # last node, so appending doesn't walk the list
+        self.size = 0      # number of nodes, kept up to date by every insert/remove
 
     # Insert a new node at the beginning (O(1))
     def insert_at_beginning(self, data):
         node = Node(data, self.head)  # new node points to old head
         self.head = node              # update head
+        if self.tail is None:
+            self.tail = node          # first node is also the last
+        self.size += 1
 
-    # Insert a new node at the end (O(n))
+    # Insert a new node at the end (O(1) thanks to the tail pointer)
     def insert_at_end(self, data):
+        node = Node(data, None)
         if self.head is None:
-            self.head = Node(data, None)  # if list empty, new node is head
-            return
+            self.head = node   # if list empty, new node is head
+        else:
+            self.tail.next = node  # attach new node at the end
+        self.tail = node
+        self.size += 1
 
-        itr = self.head
-        while itr.next:    # move to last node
-            itr = itr.next
-
-        itr.next = Node(data, None)  # attach new node at the end
-
-    # Insert a new node at a given index (O(n))
+    # Insert a new node at a given index (O(n), O(1) at either end)
     def insert_at(self, index, data):
-        if index < 0 or index > self.get_length():
+        if index < 0 or index > self.size:
             raise Exception("Invalid Index")
 
         if index == 0:
             self.insert_at_beginning(data)
             return
 
+        if index == self.size:
+            self.insert_at_end(data)
+            return
+
         count = 0
         itr = self.head
         while itr:
@@ -45,33 +57,63 @@ class LinkedList:
                 break
             itr = itr.next
             count += 1
+        self.size += 1
 
     # Remove a node at a given index (O(n))
     def remove_at(self, index):
-        if index < 0 or index >= self.get_length():
+        if index < 0 or index >= self.size:
             raise Exception("Invalid Index")
 
+        self.size -= 1
         if index == 0:
             self.head = self.head.next   # move head to 2nd node
+            if self.head is None:
+                self.tail = None         # list is now empty
             return
 
         count = 0
         itr = self.head
         while itr:
             if count == index - 1:   # node before the one to delete
+                if itr.next is self.tail:
+                    self.tail = itr      # removing the last node
                 itr.next = itr.next.next
                 break
             itr = itr.next
             count += 1
 
-    # Get the length of the linked list (O(n))
+    # Insert every value at the end, replacing the current contents (O(n) overall)
+    def insert_values(self, data_list):
+        self.head = self.tail = None
+        self.size = 0
+        for data in data_list:
+            self.insert_at_end(data)
+
+    # Get the length of the linked list (O(1))
     def get_length(self):
-        count = 0
+        return self.size
+
+    # Iterate over the values without building a list (O(1) extra memory)
+    def __iter__(self):
         itr = self.head
         while itr:
-            count += 1
+            yield itr.data
             itr = itr.next
-        return count
+
+    def __len__(self):
+        return self.size
+
+    # Stream the values to a file object, chunk_size values per write (O(n) time, O(chunk) memory)
+    def write_to(self, fileobj, sep='-->', chunk_size=1024):
+        chunk = []
+        lead = ''   # separator owed before the next chunk
+        for data in self:
+            chunk.append(str(data))
+            if len(chunk) == chunk_size:
+                fileobj.write(lead + sep.join(chunk))
+                lead, chunk = sep, []
+        if chunk:
+            fileobj.write(lead + sep.join(chunk))
 
     # Print the linked list (O(n))
     def print(self):
@@ -79,13 +121,8 @@ class LinkedList:
             print("(empty)")
             return
 
-        itr = self.head
-        llstr = ''
-        while itr:
-            suffix = '-->' if itr.next else ''
-            llstr += str(itr.data) + suffix
-            itr = itr.next
-        print(llstr)
+        self.write_to(sys.stdout)
+        sys.stdout.write('\n')
 
 
 # ---------------- DRIVER CODE ----------------
@@ -0,0 +1,242 @@
+# Benchmarks for the linked lists
+# Run from this folder: python linked_list_benchmark.py
+
+import bisect
+import gc
+import os
+import random
+import time
+import tracemalloc
+
+import linked_list
+import linked_list_excercise_2
+import linked_list_exercise_1
+import pooled_linked_list
+import skip_list
+import unrolled_linked_list
+
+
+class DictNode:
+    """Node as it was before __slots__: every instance carries a __dict__"""
+    def __init__(self, data, next):
+        self.data = data
+        self.next = next
+
+
+def bytes_per_element(build, n):
+    """Memory traced while build(n) runs, divided by n (the data values are small cached ints)"""
+    tracemalloc.start()
+    result = build(n)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return used / n
+
+
+def dict_nodes(n):
+    head = None
+    for i in range(n):
+        head = DictNode(i % 256, head)
+    return head
+
+
+def singly_linked(n):
+    ll = linked_list.LinkedList()
+    for i in range(n):
+        ll.insert_at_beginning(i % 256)
+    return ll
+
+
+def doubly_linked(n):
+    ll = linked_list_excercise_2.DoublyLinkedList()
+    for i in range(n):
+        ll.insert_at_begining(i % 256)
+    return ll
+
+
+def pooled(n):
+    ll = pooled_linked_list.PooledLinkedList(n)
+    for i in range(n):
+        ll.insert_at_beginning(i % 256)
+    return ll
+
+
+def churn(ll, size=100000, ops=2000, seed=1):
+    """Build a list of `size` elements, then do random insert_at / remove_at on it.
+    Returns (seconds, total GC pause seconds, GC runs) - pauses are measured with gc.callbacks."""
+    rng = random.Random(seed)
+    pauses = []
+    def on_gc(phase, info):
+        pauses.append(time.perf_counter())
+    gc.collect()
+    gc.callbacks.append(on_gc)
+    start = time.perf_counter()
+    for i in range(size):
+        ll.insert_at_end(i)
+    for i in range(ops):
+        if i % 2:
+            ll.insert_at(rng.randrange(ll.get_length() + 1), i)
+        else:
+            ll.remove_at(rng.randrange(ll.get_length()))
+    elapsed = time.perf_counter() - start
+    gc.callbacks.remove(on_gc)
+    pause = sum(stop - begin for begin, stop in zip(pauses[::2], pauses[1::2]))
+    return elapsed, pause, len(pauses) // 2
+
+
+def positional_ops(ll, size=10 ** 5, ops=1000, seed=2):
+    """Seconds for `ops` random insert_at / remove_at on a list of `size` elements"""
+    rng = random.Random(seed)
+    ll.insert_values(range(size))
+    start = time.perf_counter()
+    for i in range(ops):
+        if i % 2:
+            ll.insert_at(rng.randrange(ll.get_length() + 1), i)
+        else:
+            ll.remove_at(rng.randrange(ll.get_length()))
+    return time.perf_counter() - start
+
+
+def ordered_inserts(n, seed=3):
+    """Seconds to insert n random values in order and then look up the rank of each:
+    SkipList vs a Python list kept sorted with bisect.insort"""
+    rng = random.Random(seed)
+    values = [rng.random() for _ in range(n)]
+    results = {}
+
+    start = time.perf_counter()
+    sl = skip_list.SkipList(seed=seed)
+    for v in values:
+        sl.insert(v)
+    for v in values:
+        sl.rank(v)
+    results["SkipList"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ordered = []
+    for v in values:
+        bisect.insort(ordered, v)
+    for v in values:
+        bisect.bisect_left(ordered, v)
+    results["bisect.insort list"] = time.perf_counter() - start
+    return results
+
+
+def value_edits(ll, size=20000, ops=2000, seed=4):
+    """Seconds for `ops` insert_after_value + remove_by_value pairs on random values"""
+    rng = random.Random(seed)
+    ll.insert_values(range(size))
+    start = time.perf_counter()
+    for i in range(ops):
+        ll.insert_after_value(rng.randrange(size), size + i)
+        ll.remove_by_value(rng.randrange(size))
+    return time.perf_counter() - start
+
+
+def duplicate_inserts(ll, size=10 ** 5, ops=500):
+    """Seconds for `ops` insert_after_value calls that each add another copy of the middle
+    value right after its first occurrence, so the new node lands among its duplicates"""
+    middle = size // 2
+    ll.insert_values(range(size))
+    start = time.perf_counter()
+    for _ in range(ops):
+        ll.insert_after_value(middle, middle)
+    return time.perf_counter() - start
+
+
+def dump(n):
+    """Seconds to write an n-node DoublyLinkedList to os.devnull:
+    string concatenation (the old print_forward) vs streaming write_to"""
+    ll = linked_list_excercise_2.DoublyLinkedList()
+    ll.insert_values(range(n))
+    with open(os.devnull, "w") as out:
+        start = time.perf_counter()
+        itr, llstr = ll.head, ''
+        while itr:
+            llstr += str(itr.data) + ' --> '
+            itr = itr.next
+        out.write(llstr)
+        concat = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ll.write_to(out)
+        streamed = time.perf_counter() - start
+    return concat, streamed
+
+
+def concatenate(cls, n, parts=10):
+    """Seconds to join `parts` lists of n // parts nodes: re-appending every value
+    vs splicing with extend_from"""
+    chunks = [range(i * n // parts, (i + 1) * n // parts) for i in range(parts)]
+    lists = [cls.from_iterable(chunk) for chunk in chunks]
+    start = time.perf_counter()
+    joined = cls()
+    for other in lists:
+        for data in other:
+            joined.insert_at_end(data)
+    appended = time.perf_counter() - start
+    del joined   # freeing the copy shouldn't count against the splice
+
+    joined = cls()
+    start = time.perf_counter()
+    for other in lists:
+        joined.extend_from(other)
+    spliced = time.perf_counter() - start
+    return appended, spliced
+
+
+if __name__ == "__main__":
+    n = 10 ** 6
+    print(f"Bytes per element for {n} nodes")
+    print(f"    node with __dict__       {bytes_per_element(dict_nodes, n):6.1f}")
+    print(f"    LinkedList (slots)       {bytes_per_element(singly_linked, n):6.1f}")
+    print(f"    DoublyLinkedList (slots) {bytes_per_element(doubly_linked, n):6.1f}")
+    print(f"    PooledLinkedList         {bytes_per_element(pooled, n):6.1f}")
+
+    print()
+    print("Build 10^5 elements, then 2000 random insert_at / remove_at")
+    for name, ll in (("LinkedList", linked_list.LinkedList()),
+                     ("PooledLinkedList", pooled_linked_list.PooledLinkedList())):
+        elapsed, pause, runs = churn(ll)
+        print(f"    {name:17} {elapsed:6.2f}s  gc runs={runs:5}  gc pause={pause * 1000:7.2f} ms")
+
+    print()
+    print("1000 random insert_at / remove_at on 10^5 elements")
+    for name, ll in (("LinkedList", linked_list.LinkedList()),
+                     ("DoublyLinkedList", linked_list_excercise_2.DoublyLinkedList()),
+                     ("UnrolledLinkedList", unrolled_linked_list.UnrolledLinkedList())):
+        print(f"    {name:18} {positional_ops(ll):6.2f}s")
+
+    print()
+    print("Sorted inserts + rank lookups")
+    for n in (10 ** 4, 10 ** 5, 10 ** 6):
+        for name, elapsed in ordered_inserts(n).items():
+            print(f"    n={n:<8} {name:18} {elapsed:6.2f}s")
+
+    print()
+    print("2000 insert_after_value + remove_by_value on 2*10^4 elements")
+    for name, cls in (("LinkedList", linked_list_exercise_1.LinkedList),
+                      ("DoublyLinkedList", linked_list_excercise_2.DoublyLinkedList)):
+        scan = value_edits(cls())
+        indexed = value_edits(cls(index_values=True))
+        print(f"    {name:17} scan {scan:6.2f}s   indexed {indexed:6.4f}s")
+
+    print()
+    print("500 insert_after_value adding duplicates of the middle value, 10^5 elements")
+    for name, cls in (("LinkedList", linked_list_exercise_1.LinkedList),
+                      ("DoublyLinkedList", linked_list_excercise_2.DoublyLinkedList)):
+        scan = duplicate_inserts(cls())
+        indexed = duplicate_inserts(cls(index_values=True))
+        print(f"    {name:17} scan {scan:6.2f}s   indexed {indexed:6.4f}s")
+
+    print()
+    for n in (10 ** 4, 3 * 10 ** 4, 10 ** 5):   # concatenation is quadratic, 10^6 takes too long
+        concat, streamed = dump(n)
+        print(f"Dump {n} nodes: concatenation {concat:.2f}s, write_to {streamed:.3f}s")
+
+    print()
+    print("Join 10 lists into one 10^6 element list")
+    for name, cls in (("LinkedList", linked_list_exercise_1.LinkedList),
+                      ("DoublyLinkedList", linked_list_excercise_2.DoublyLinkedList)):
+        appended, spliced = concatenate(cls, 10 ** 6)
+        print(f"    {name:17} append {appended:6.2f}s   extend_from {spliced * 1e6:6.1f}us")
@@ -15,126 +15,312 @@
 #     # Print linked list in reverse direction. Use node.prev for this.
 # Implement all other methods in regular linked list class and make necessary changes for doubly linked list (you need to populate node.prev in all those methods)
 
+import sys
+from bisect import bisect_left
+from operator import attrgetter
+
+LABEL_GAP = 1 << 20          # label spacing for nodes added at either end of an indexed list
+_label = attrgetter("label")
 
 
 class Node:
+    __slots__ = ("data", "next", "prev", "label")
+
     def __init__(self, data=None, next=None, prev=None):
         self.data = data
         self.next = next
         self.prev = prev
+        self.label = 0   # order label, only kept up to date in indexed lists
 
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, index_values=False):
         self.head = None
+        self.tail = None   # last node: O(1) get_last_node and appends
+        self.size = 0      # node count: O(1) length, and tells which end is nearer
+        # Optional value -> [nodes holding it, in list order], kept up to date by every
+        # insert/remove so insert_after_value and remove_by_value find their node without a
+        # scan (values must be hashable). Nodes of an indexed list carry labels that increase
+        # along the list, so a node's place among k equal values is an O(log k) bisect on
+        # labels (plus the list insert / delete shifting up to k entries).
+        self.index = {} if index_values else None
 
     def print_forward(self):
         if self.head is None:
             print("Linked list is empty")
             return
 
-        itr = self.head
-        llstr = ''
-        while itr:
-            llstr += str(itr.data) + ' --> '
-            itr = itr.next
-        print(llstr)
+        self.write_to(sys.stdout)
+        sys.stdout.write('\n')
 
     def print_backward(self):
         if self.head is None:
             print("Linked list is empty")
             return
 
-        last_node = self.get_last_node()
-        itr = last_node
-        llstr = ''
+        sys.stdout.write("Link list in reverse:  ")
+        self.write_to(sys.stdout, sep='-->', reverse=True)
+        sys.stdout.write('\n')
+
+    def __iter__(self):
+        itr = self.head
+        while itr:
+            yield itr.data
+            itr = itr.next
+
+    def __reversed__(self):
+        itr = self.tail
         while itr:
-            llstr += itr.data + '-->'
+            yield itr.data
             itr = itr.prev
-        print("Link list in reverse: ", llstr)
+
+    def __len__(self):
+        return self.size
+
+    def write_to(self, fileobj, sep=' --> ', reverse=False, chunk_size=1024):
+        """Stream every value followed by sep, chunk_size values per write"""
+        chunk = []
+        for data in (reversed(self) if reverse else self):
+            chunk.append(str(data))
+            if len(chunk) == chunk_size:
+                fileobj.write(sep.join(chunk) + sep)
+                chunk = []
+        if chunk:
+            fileobj.write(sep.join(chunk) + sep)
 
     def get_last_node(self):
-        itr = self.head
-        while itr.next:
-            itr = itr.next
+        return self.tail
 
+    def get_length(self):
+        return self.size
+
+    def _node_at(self, index):
+        """Node at index, walking from head or tail, whichever is nearer (at most n/2 steps)"""
+        if index < self.size // 2:
+            itr = self.head
+            for _ in range(index):
+                itr = itr.next
+        else:
+            itr = self.tail
+            for _ in range(self.size - 1 - index):
+                itr = itr.prev
         return itr
 
-    def get_length(self):
-        count = 0
-        itr = self.head
-        while itr:
-            count+=1
-            itr = itr.next
+    def _index_add(self, node):
+        """Label a newly linked node and record it in the value index at its place among equal values"""
+        if self.index is None:
+            return
+        prev, nxt = node.prev, node.next
+        if prev is None:
+            node.label = nxt.label - LABEL_GAP if nxt else 0
+        elif nxt is None:
+            node.label = prev.label + LABEL_GAP
+        else:
+            if nxt.label - prev.label < 2:
+                self._relabel(prev, nxt)
+            node.label = (prev.label + nxt.label) // 2
+        nodes = self.index.setdefault(node.data, [])
+        nodes.insert(bisect_left(nodes, node.label, key=_label), node)
 
-        return count
+    def _relabel(self, prev, nxt):
+        """No label left between prev and nxt: respace the shortest run of nodes from nxt on
+        whose label range is roomy (over 2 * (run length + 1)**2), or the run up to the tail"""
+        run, end = [], nxt
+        while end is not None and end.label - prev.label <= 2 * (len(run) + 1) ** 2:
+            run.append(end)
+            end = end.next
+        step = LABEL_GAP if end is None else (end.label - prev.label) // (len(run) + 1)
+        for i, node in enumerate(run, 1):
+            node.label = prev.label + i * step
+
+    def _index_remove(self, node):
+        if self.index is None:
+            return
+        nodes = self.index[node.data]
+        del nodes[bisect_left(nodes, node.label, key=_label)]
+        if not nodes:
+            del self.index[node.data]
 
     def insert_at_begining(self, data):
         if self.head == None:
             node = Node(data, self.head, None)
-            self.head = node
+            self.head = self.tail = node
         else:
             node = Node(data, self.head, None)
             self.head.prev = node
             self.head = node
+        self.size += 1
+        self._index_add(node)
 
     def insert_at_end(self, data):
         if self.head is None:
-            self.head = Node(data, None, None)
+            self.insert_at_begining(data)
             return
 
-        itr = self.head
-
-        while itr.next:
-            itr = itr.next
-
-        itr.next = Node(data, None, itr)
+        self._insert_after_node(self.tail, data)
 
     def insert_at(self, index, data):
-        if index<0 or index>self.get_length():
+        if index<0 or index>self.size:
             raise Exception("Invalid Index")
 
         if index==0:
             self.insert_at_begining(data)
             return
 
-        count = 0
-        itr = self.head
-        while itr:
-            if count == index - 1:
-                node = Node(data, itr.next, itr)
-                if node.next:
-                    node.next.prev = node
-                itr.next = node
-                break
+        if index==self.size:
+            self.insert_at_end(data)
+            return
 
-            itr = itr.next
-            count += 1
+        self._insert_after_node(self._node_at(index - 1), data)
+
+    def _insert_after_node(self, itr, data):
+        node = Node(data, itr.next, itr)
+        if node.next:
+            node.next.prev = node
+        else:
+            self.tail = node
+        itr.next = node
+        self.size += 1
+        self._index_add(node)
 
     def remove_at(self, index):
-        if index<0 or index>=self.get_length():
+        if index<0 or index>=self.size:
             raise Exception("Invalid Index")
 
-        if index==0:
-            self.head = self.head.next
-            self.head.prev = None
+        self._remove_node(self._node_at(index))
+
+    def _remove_node(self, itr):
+        """Unlink a node; with prev pointers this is O(1) wherever it is"""
+        self._index_remove(itr)
+        if itr.prev:
+            itr.prev.next = itr.next
+        else:
+            self.head = itr.next
+        if itr.next:
+            itr.next.prev = itr.prev
+        else:
+            self.tail = itr.prev
+        self.size -= 1
+
+    def insert_values(self, data_list):
+        """Replace the contents, linking the nodes in a single pass"""
+        self.head = self.tail = None
+        self.size = 0
+        if self.index is not None:
+            self.index = {}
+        prev = None
+        for data in data_list:
+            node = Node(data, None, prev)
+            if prev is None:
+                self.head = node
+            else:
+                prev.next = node
+            prev = node
+            self.size += 1
+            if self.index is not None:
+                node.label = self.size * LABEL_GAP
+                self.index.setdefault(data, []).append(node)
+        self.tail = prev
+
+    @classmethod
+    def from_iterable(cls, data_list, index_values=False):
+        ll = cls(index_values)
+        ll.insert_values(data_list)
+        return ll
+
+    def extend_from(self, other):
+        """Move all of other's nodes to the end of this list (O(1) splice, other ends up empty).
+        With a value index, other's entries are merged in: O(distinct values of other), plus
+        O(len(other)) when other's nodes need new labels to follow this list's."""
+        if other is self or other.head is None:
             return
+        if self.index is not None and (other.index is None or
+                                       (self.tail is not None and other.head.label <= self.tail.label)):
+            base = self.tail.label if self.tail is not None else 0
+            for i, node in enumerate(other._nodes(), 1):
+                node.label = base + i * LABEL_GAP
+        if self.head is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        self.tail = other.tail
+        self.size += other.size
+
+        if self.index is not None:
+            if other.index is not None:
+                for data, nodes in other.index.items():
+                    self.index.setdefault(data, []).extend(nodes)
+            else:
+                for node in other._nodes():
+                    self.index.setdefault(node.data, []).append(node)
+
+        other.head = other.tail = None
+        other.size = 0
+        if other.index is not None:
+            other.index = {}
+
+    def split_at(self, index):
+        """Cut the list before position index: this list keeps [0, index), the rest is
+        returned as a new list. The nodes are reused, nothing is copied."""
+        if index<0 or index>self.size:
+            raise Exception("Invalid Index")
+
+        rest = type(self)(self.index is not None)
+        if index == self.size:
+            return rest
+        if index == 0:
+            rest.extend_from(self)
+            return rest
+
+        first = self._node_at(index)   # walks from the nearer end
+        rest.head, rest.tail, rest.size = first, self.tail, self.size - index
+        self.tail, self.size = first.prev, index
+        first.prev.next = None
+        first.prev = None
 
-        count = 0
+        if self.index is not None:
+            # The moved nodes are the last entries of each value's list
+            for node in rest._nodes():
+                rest.index.setdefault(node.data, []).append(node)
+            for data, nodes in rest.index.items():
+                del self.index[data][-len(nodes):]
+                if not self.index[data]:
+                    del self.index[data]
+        return rest
+
+    def _nodes(self):
         itr = self.head
         while itr:
-            if count == index:
-                itr.prev.next = itr.next
-                if itr.next:
-                    itr.next.prev = itr.prev
-                break
+            yield itr
+            itr = itr.next
+
+    def insert_after_value(self, data_after, data_to_insert):
+        if self.index is not None:
+            nodes = self.index.get(data_after)
+            if nodes:
+                self._insert_after_node(nodes[0], data_to_insert)
+            return
 
+        itr = self.head
+        while itr:
+            if itr.data == data_after:
+                self._insert_after_node(itr, data_to_insert)
+                break
             itr = itr.next
-            count+=1
 
-    def insert_values(self, data_list):
-        self.head = None
-        for data in data_list:
-            self.insert_at_end(data)
+    def remove_by_value(self, data):
+        if self.index is not None:
+            nodes = self.index.get(data)
+            if nodes:
+                self._remove_node(nodes[0])
+            return
+
+        itr = self.head
+        while itr:
+            if itr.data == data:
+                self._remove_node(itr)
+                break
+            itr = itr.next
 
 
 if __name__ == '__main__':
@@ -22,60 +22,130 @@
 #     ll.remove_by_value("grapes")
 #     ll.print()
 
+import sys
+from bisect import bisect_left
+from operator import attrgetter
+
+LABEL_GAP = 1 << 20          # label spacing for nodes added at either end of an indexed list
+_label = attrgetter("label")
+
+
 class Node:
+    __slots__ = ("data", "next", "label")
+
     def __init__(self, data=None, next=None):
         self.data = data
         self.next = next
+        self.label = 0   # order label, only kept up to date in indexed lists
 
 class LinkedList:
-    def __init__(self):
+    def __init__(self, index_values=False):
         self.head = None
+        self.tail = None   # last node, so insert_at_end is O(1)
+        self.size = 0      # node count, so get_length and bounds checks are O(1)
+        # Optional value -> [nodes holding it, in list order], kept up to date by every
+        # insert/remove so insert_after_value and remove_by_value don't scan (values must be hashable).
+        # Nodes of an indexed list carry labels that increase along the list, so a node's place
+        # among equal values is a bisect on labels, not a walk.
+        self.index = {} if index_values else None
 
     def print(self):
         if self.head is None:
             print("Linked list is empty")
             return
 
+        self.write_to(sys.stdout)
+        sys.stdout.write('\n')
+
+    def __iter__(self):
         itr = self.head
-        llstr = ''
         while itr:
-            llstr += str(itr.data) + ' --> '
+            yield itr.data
             itr = itr.next
-        print(llstr)
+
+    def __len__(self):
+        return self.size
+
+    def write_to(self, fileobj, sep=' --> ', chunk_size=1024):
+        """Stream every value followed by sep, chunk_size values per write"""
+        chunk = []
+        for data in self:
+            chunk.append(str(data))
+            if len(chunk) == chunk_size:
+                fileobj.write(sep.join(chunk) + sep)
+                chunk = []
+        if chunk:
+            fileobj.write(sep.join(chunk) + sep)
 
     def get_length(self):
-        count = 0
-        itr = self.head
-        while itr:
-            count+=1
-            itr = itr.next
+        return self.size
 
-        return count
+    def _index_add(self, node, prev):
+        """Label node, just linked in after prev (None at the head), and record it in the
+        value index at its place among equal values"""
+        if self.index is None:
+            return
+        nxt = node.next
+        if prev is None:
+            node.label = nxt.label - LABEL_GAP if nxt else 0
+        elif nxt is None:
+            node.label = prev.label + LABEL_GAP
+        else:
+            if nxt.label - prev.label < 2:
+                self._relabel(prev, nxt)
+            node.label = (prev.label + nxt.label) // 2
+        nodes = self.index.setdefault(node.data, [])
+        nodes.insert(bisect_left(nodes, node.label, key=_label), node)
+
+    def _relabel(self, prev, nxt):
+        """No label left between prev and nxt: respace the shortest run of nodes from nxt on
+        whose label range is roomy (over 2 * (run length + 1)**2), or the run up to the tail"""
+        run, end = [], nxt
+        while end is not None and end.label - prev.label <= 2 * (len(run) + 1) ** 2:
+            run.append(end)
+            end = end.next
+        step = LABEL_GAP if end is None else (end.label - prev.label) // (len(run) + 1)
+        for i, node in enumerate(run, 1):
+            node.label = prev.label + i * step
+
+    def _index_remove(self, node):
+        if self.index is None:
+            return
+        nodes = self.index[node.data]
+        del nodes[bisect_left(nodes, node.label, key=_label)]
+        if not nodes:
+            del self.index[node.data]
 
     def insert_at_begining(self, data):
         node = Node(data, self.head)
         self.head = node
+        if self.tail is None:
+            self.tail = node
+        self.size += 1
+        self._index_add(node, None)
 
     def insert_at_end(self, data):
+        node, prev = Node(data, None), self.tail
         if self.head is None:
-            self.head = Node(data, None)
-            return
-
-        itr = self.head
-
-        while itr.next:
-            itr = itr.next
-
-        itr.next = Node(data, None)
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.size += 1
+        self._index_add(node, prev)
 
     def insert_at(self, index, data):
-        if index<0 or index>self.get_length():
+        if index<0 or index>self.size:
             raise Exception("Invalid Index")
 
         if index==0:
             self.insert_at_begining(data)
             return
 
+        if index==self.size:
+            self.insert_at_end(data)
+            return
+
         count = 0
         itr = self.head
         while itr:
@@ -86,19 +156,28 @@ class LinkedList:
 
             itr = itr.next
             count += 1
+        self.size += 1
+        self._index_add(node, itr)
 
     def remove_at(self, index):
-        if index<0 or index>=self.get_length():
+        if index<0 or index>=self.size:
             raise Exception("Invalid Index")
 
+        self.size -= 1
         if index==0:
+            self._index_remove(self.head)
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
             return
 
         count = 0
         itr = self.head
         while itr:
             if count == index - 1:
+                self._index_remove(itr.next)
+                if itr.next is self.tail:
+                    self.tail = itr
                 itr.next = itr.next.next
                 break
 
@@ -106,42 +185,174 @@ class LinkedList:
             count+=1
 
     def insert_values(self, data_list):
-        self.head = None
+        """Replace the contents, linking the nodes in a single pass"""
+        self.head = self.tail = None
+        self.size = 0
+        if self.index is not None:
+            self.index = {}
+        prev = None
         for data in data_list:
-            self.insert_at_end(data)
+            node = Node(data, None)
+            if prev is None:
+                self.head = node
+            else:
+                prev.next = node
+            prev = node
+            self.size += 1
+            if self.index is not None:
+                node.label = self.size * LABEL_GAP
+                self.index.setdefault(data, []).append(node)
+        self.tail = prev
+
+    @classmethod
+    def from_iterable(cls, data_list, index_values=False):
+        ll = cls(index_values)
+        ll.insert_values(data_list)
+        return ll
+
+    def extend_from(self, other):
+        """Move all of other's nodes to the end of this list (O(1) splice, other ends up empty).
+        With a value index, other's entries are merged in: O(distinct values of other), plus
+        O(len(other)) when other's nodes need new labels to follow this list's."""
+        if other is self or other.head is None:
+            return
+        if self.index is not None and (other.index is None or
+                                       (self.tail is not None and other.head.label <= self.tail.label)):
+            base = self.tail.label if self.tail is not None else 0
+            for i, node in enumerate(other._nodes(), 1):
+                node.label = base + i * LABEL_GAP
+        if self.head is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
+        self.size += other.size
+
+        if self.index is not None:
+            if other.index is not None:
+                for data, nodes in other.index.items():
+                    self.index.setdefault(data, []).extend(nodes)
+            else:
+                for node in other._nodes():
+                    self.index.setdefault(node.data, []).append(node)
+
+        other.head = other.tail = None
+        other.size = 0
+        if other.index is not None:
+            other.index = {}
+
+    def split_at(self, index):
+        """Cut the list before position index: this list keeps [0, index), the rest is
+        returned as a new list. The nodes are reused, nothing is copied."""
+        if index<0 or index>self.size:
+            raise Exception("Invalid Index")
+
+        rest = type(self)(self.index is not None)
+        if index == self.size:
+            return rest
+        if index == 0:
+            rest.extend_from(self)
+            return rest
+
+        itr = self.head
+        for _ in range(index - 1):
+            itr = itr.next
+        rest.head, rest.tail, rest.size = itr.next, self.tail, self.size - index
+        itr.next = None
+        self.tail, self.size = itr, index
+
+        if self.index is not None:
+            # The moved nodes are the last entries of each value's list
+            for node in rest._nodes():
+                rest.index.setdefault(node.data, []).append(node)
+            for data, nodes in rest.index.items():
+                del self.index[data][-len(nodes):]
+                if not self.index[data]:
+                    del self.index[data]
+        return rest
+
+    def _nodes(self):
+        itr = self.head
+        while itr:
+            yield itr
+            itr = itr.next
 
 
     def insert_after_value(self, data_after, data_to_insert):
         if self.head is None:
             return
 
-        if self.head.data==data_after:
-            self.head.next = Node(data_to_insert,self.head.next)
+        if self.index is not None:
+            # O(1) with the index: jump straight to the first node holding data_after
+            nodes = self.index.get(data_after)
+            if nodes:
+                self._insert_after_node(nodes[0], data_to_insert)
             return
 
         itr = self.head
         while itr:
             if itr.data == data_after:
-                itr.next = Node(data_to_insert, itr.next)
+                self._insert_after_node(itr, data_to_insert)
                 break
 
             itr = itr.next
 
+    def _insert_after_node(self, itr, data):
+        itr.next = Node(data, itr.next)
+        if itr is self.tail:
+            self.tail = itr.next
+        self.size += 1
+        self._index_add(itr.next, itr)
+
     def remove_by_value(self, data):
         if self.head is None:
             return
 
+        if self.index is not None:
+            nodes = self.index.get(data)
+            if nodes:
+                self._remove_node(nodes[0])
+            return
+
         if self.head.data == data:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+            self.size -= 1
             return
 
         itr = self.head
         while itr.next:
             if itr.next.data == data:
+                if itr.next is self.tail:
+                    self.tail = itr
                 itr.next = itr.next.next
+                self.size -= 1
                 break
             itr = itr.next
 
+    def _remove_node(self, node):
+        """Remove a node found through the index. Without a prev pointer the node is
+        removed by pulling its successor's value into it and unlinking the successor
+        (O(1)); only the tail has to be found the long way."""
+        self._index_remove(node)
+        self.size -= 1
+        nxt = node.next
+        if nxt is not None:
+            nodes = self.index[nxt.data]
+            nodes[bisect_left(nodes, nxt.label, key=_label)] = node   # node now stands in for its successor
+            node.data, node.next, node.label = nxt.data, nxt.next, nxt.label
+            if nxt is self.tail:
+                self.tail = node
+        elif node is self.head:
+            self.head = self.tail = None
+        else:
+            itr = self.head
+            while itr.next is not node:
+                itr = itr.next
+            itr.next = None
+            self.tail = itr
+
 if __name__ == '__main__':
     ll = LinkedList()
     ll.insert_values(["banana","mango","grapes","orange"])
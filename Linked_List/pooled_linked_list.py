@@ -0,0 +1,173 @@
+# Linked list whose nodes live in preallocated parallel arrays instead of Node objects.
+# A node is just an index i: its value is data[i], its neighbours are next[i] and prev[i].
+# Removed nodes go on a free list (chained through next) and are reused by later inserts,
+# so inserting and removing never allocates a Python object and the GC has nothing to track.
+
+from array import array
+
+NIL = -1   # "no node", plays the role of None
+
+
+class PooledLinkedList:
+    def __init__(self, capacity=16):
+        self.next = array("q")
+        self.prev = array("q")
+        self.data = []
+        self.free = NIL    # first unused node
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+        self._grow(capacity)
+
+    # Add `extra` unused nodes to the pool and put them on the free list
+    def _grow(self, extra):
+        old = len(self.data)
+        new = old + max(extra, 1)
+        self.next.extend(range(old + 1, new + 1))
+        self.next[new - 1] = self.free
+        self.prev.extend(array("q", [NIL]) * (new - old))
+        self.data.extend([None] * (new - old))
+        self.free = old
+
+    # Make sure n more nodes can be inserted without growing the pool
+    def reserve(self, n):
+        spare = len(self.data) - self.size
+        if n > spare:
+            self._grow(n - spare)
+
+    # Take a node from the free list (pool doubles when empty)
+    def _alloc(self, data):
+        if self.free == NIL:
+            self._grow(len(self.data))
+        i = self.free
+        self.free = self.next[i]
+        self.data[i] = data
+        return i
+
+    # Give a node back to the free list
+    def _release(self, i):
+        self.data[i] = None   # drop the reference so the value can be freed
+        self.next[i] = self.free
+        self.free = i
+
+    # Node at a position, walking from whichever end is nearer
+    def _node_at(self, index):
+        if index < self.size // 2:
+            i = self.head
+            for _ in range(index):
+                i = self.next[i]
+        else:
+            i = self.tail
+            for _ in range(self.size - 1 - index):
+                i = self.prev[i]
+        return i
+
+    # Insert a new node at the beginning (O(1))
+    def insert_at_beginning(self, data):
+        i = self._alloc(data)
+        self.next[i] = self.head
+        self.prev[i] = NIL
+        if self.head == NIL:
+            self.tail = i
+        else:
+            self.prev[self.head] = i
+        self.head = i
+        self.size += 1
+
+    # Insert a new node at the end (O(1))
+    def insert_at_end(self, data):
+        i = self._alloc(data)
+        self.prev[i] = self.tail
+        self.next[i] = NIL
+        if self.tail == NIL:
+            self.head = i
+        else:
+            self.next[self.tail] = i
+        self.tail = i
+        self.size += 1
+
+    # Insert a new node at a given index (O(n), O(1) at either end)
+    def insert_at(self, index, data):
+        if index < 0 or index > self.size:
+            raise Exception("Invalid Index")
+
+        if index == 0:
+            self.insert_at_beginning(data)
+            return
+        if index == self.size:
+            self.insert_at_end(data)
+            return
+
+        after = self._node_at(index)   # node that moves one place back
+        before = self.prev[after]
+        i = self._alloc(data)
+        self.prev[i], self.next[i] = before, after
+        self.next[before] = i
+        self.prev[after] = i
+        self.size += 1
+
+    # Remove a node at a given index (O(n), O(1) at either end)
+    def remove_at(self, index):
+        if index < 0 or index >= self.size:
+            raise Exception("Invalid Index")
+
+        i = self._node_at(index)
+        before, after = self.prev[i], self.next[i]
+        if before == NIL:
+            self.head = after
+        else:
+            self.next[before] = after
+        if after == NIL:
+            self.tail = before
+        else:
+            self.prev[after] = before
+        self._release(i)
+        self.size -= 1
+
+    # Replace the contents with the given values
+    def insert_values(self, data_list):
+        while self.head != NIL:   # recycle the old nodes
+            after = self.next[self.head]
+            self._release(self.head)
+            self.head = after
+        self.tail = NIL
+        self.size = 0
+        for data in data_list:
+            self.insert_at_end(data)
+
+    # Get the length of the linked list (O(1))
+    def get_length(self):
+        return self.size
+
+    # Print the linked list (O(n))
+    def print(self):
+        if self.head == NIL:
+            print("(empty)")
+            return
+
+        values = []
+        i = self.head
+        while i != NIL:
+            values.append(str(self.data[i]))
+            i = self.next[i]
+        print('-->'.join(values))
+
+
+# ---------------- DRIVER CODE ----------------
+if __name__ == '__main__':
+    root = PooledLinkedList()
+
+    root.insert_at_end(5)
+    root.insert_at_end(898)
+    root.insert_at_beginning(77)
+    root.insert_at(1, 99)      # between 77 and 5
+    root.insert_at(4, 1000)    # at end
+    root.print()               # Output: 77-->99-->5-->898-->1000
+
+    root.remove_at(0)   # remove 77 (head)
+    root.remove_at(2)   # remove 898
+    root.print()        # Output: 99-->5-->1000
+    print("Length:", root.get_length())  # Output: 3
+
+    root.insert_at_end(7)   # reuses a freed node
+    root.print()            # Output: 99-->5-->1000-->7
@@ -0,0 +1,182 @@
+# Indexable skip list: a sorted linked list with extra "express lane" links on top.
+# Each node gets a random height; a node at level i links to the next node of height > i,
+# so a search drops down through the levels and skips most of the list: O(log n) expected.
+#
+# Every link also stores its span (how many positions it jumps), which makes it
+# indexable: walking by spans finds the k-th item, and summing them gives an item's rank.
+# Positions are counted from 1, the head sentinel sits at position 0, and a link to None
+# spans to position size + 1.
+
+import random
+
+MAX_LEVEL = 32
+P = 0.25   # chance that a node also appears on the next level up
+
+
+class Node:
+    __slots__ = ("data", "next", "span")
+
+    def __init__(self, data, level):
+        self.data = data
+        self.next = [None] * level   # next[i]: following node on level i
+        self.span = [1] * level      # span[i]: positions jumped by next[i]
+
+
+class SkipList:
+    def __init__(self, seed=None):
+        self.head = Node(None, MAX_LEVEL)
+        self.level = 1               # levels currently in use
+        self.size = 0
+        self.rng = random.Random(seed)
+
+    def _random_level(self):
+        level = 1
+        while level < MAX_LEVEL and self.rng.random() < P:
+            level += 1
+        return level
+
+    # For every level, the last node before `data` and its position.
+    # strict=True stops before equal items (first occurrence), False goes past them.
+    def _path_by_value(self, data, strict):
+        update, rank = [None] * MAX_LEVEL, [0] * MAX_LEVEL
+        itr, pos = self.head, 0
+        for i in reversed(range(self.level)):
+            while itr.next[i] and (itr.next[i].data < data if strict else itr.next[i].data <= data):
+                pos += itr.span[i]
+                itr = itr.next[i]
+            update[i], rank[i] = itr, pos
+        return update, rank
+
+    # For every level, the last node at position <= index and its position
+    def _path_by_index(self, index):
+        update, rank = [None] * MAX_LEVEL, [0] * MAX_LEVEL
+        itr, pos = self.head, 0
+        for i in reversed(range(self.level)):
+            while itr.next[i] and pos + itr.span[i] <= index:
+                pos += itr.span[i]
+                itr = itr.next[i]
+            update[i], rank[i] = itr, pos
+        return update, rank
+
+    # Link a new node right after update[0] (at position rank[0] + 1)
+    def _link(self, update, rank, data):
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                update[i], rank[i] = self.head, 0
+                self.head.span[i] = self.size + 1   # unused level: spans the whole list
+            self.level = level
+
+        node = Node(data, level)
+        pos = rank[0]
+        for i in range(level):
+            node.next[i] = update[i].next[i]
+            update[i].next[i] = node
+            # update[i]'s old span is split around the new node
+            node.span[i] = update[i].span[i] - (pos - rank[i])
+            update[i].span[i] = pos - rank[i] + 1
+        for i in range(level, self.level):
+            update[i].span[i] += 1   # links passing over the new node get one longer
+        self.size += 1
+
+    # Unlink the node right after update[0]
+    def _unlink(self, update):
+        target = update[0].next[0]
+        for i in range(self.level):
+            if update[i].next[i] is target:
+                update[i].span[i] += target.span[i] - 1
+                update[i].next[i] = target.next[i]
+            else:
+                update[i].span[i] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        return target.data
+
+    # Insert data in sorted position, after any equal items (O(log n))
+    def insert(self, data):
+        self._link(*self._path_by_value(data, strict=False), data)
+
+    # Insert data at a given index; data must fit the order there (O(log n))
+    def insert_at(self, index, data):
+        if index < 0 or index > self.size:
+            raise Exception("Invalid Index")
+        update, rank = self._path_by_index(index)
+        before, after = update[0], update[0].next[0]
+        if (before is not self.head and data < before.data) or (after and after.data < data):
+            raise ValueError(f"{data!r} does not belong at index {index} of a sorted list")
+        self._link(update, rank, data)
+
+    # Remove the first item equal to data, if there is one (O(log n))
+    def remove_by_value(self, data):
+        update, _ = self._path_by_value(data, strict=True)
+        target = update[0].next[0]
+        if target is not None and target.data == data:
+            self._unlink(update)
+
+    # Remove and return the item at index (O(log n))
+    def remove_at(self, index):
+        if index < 0 or index >= self.size:
+            raise Exception("Invalid Index")
+        return self._unlink(self._path_by_index(index)[0])
+
+    # True if data is in the list (O(log n))
+    def search(self, data):
+        target = self._path_by_value(data, strict=True)[0][0].next[0]
+        return target is not None and target.data == data
+
+    def __contains__(self, data):
+        return self.search(data)
+
+    # Number of items smaller than data, i.e. the index data has or would have (O(log n))
+    def rank(self, data):
+        return self._path_by_value(data, strict=True)[1][0]
+
+    # Item at index (O(log n))
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError("Invalid Index")
+        return self._path_by_index(index + 1)[0][0].data
+
+    def __len__(self):
+        return self.size
+
+    def get_length(self):
+        return self.size
+
+    # Replace the contents with the given values, kept in sorted order
+    def insert_values(self, data_list):
+        self.head = Node(None, MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+        for data in data_list:
+            self.insert(data)
+
+    def print(self):
+        if self.size == 0:
+            print("Skip list is empty")
+            return
+
+        values = []
+        itr = self.head.next[0]
+        while itr:
+            values.append(str(itr.data))
+            itr = itr.next[0]
+        print(' --> '.join(values))
+
+
+if __name__ == '__main__':
+    sl = SkipList(seed=7)
+    sl.insert_values(["mango", "banana", "orange", "grapes"])
+    sl.print()                            # banana --> grapes --> mango --> orange
+    sl.insert("apple")
+    print("rank of mango:", sl.rank("mango"))   # 3
+    print("item at 1:", sl[1])                  # banana
+    sl.remove_by_value("orange")
+    sl.remove_at(0)                             # apple
+    sl.print()                                  # banana --> grapes --> mango
+    print("has figs:", "figs" in sl)
+    sl.insert_at(2, "kiwi")                     # between grapes and mango
+    sl.print()
@@ -0,0 +1,162 @@
+# Unrolled linked list: every node holds a small block (up to `capacity` items) instead of one item.
+# Finding a position skips a whole block per step, so insert_at / remove_at touch about
+# n / capacity nodes instead of n, and iterating reads items from contiguous Python lists.
+#
+# Blocks are split in half when they overflow, and a block that drops below half full
+# absorbs the next one when both fit, so nodes don't degrade into one item each.
+
+
+class Node:
+    __slots__ = ("items", "next")
+
+    def __init__(self, items=None, next=None):
+        self.items = items if items is not None else []   # block of values, in order
+        self.next = next
+
+
+class UnrolledLinkedList:
+    def __init__(self, capacity=64):
+        self.capacity = capacity   # maximum items per node
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    # (previous node, node, offset) holding position index, for 0 <= index < size
+    def _find(self, index):
+        prev, itr = None, self.head
+        while index >= len(itr.items):
+            index -= len(itr.items)
+            prev, itr = itr, itr.next
+        return prev, itr, index
+
+    # Put data at offset in node, splitting the node if it overflows
+    def _insert_into(self, node, offset, data):
+        node.items.insert(offset, data)
+        self.size += 1
+        if len(node.items) > self.capacity:
+            half = len(node.items) // 2
+            node.next = Node(node.items[half:], node.next)
+            del node.items[half:]
+            if node is self.tail:
+                self.tail = node.next
+
+    # Remove the item at offset in node, then drop or merge the node if it got too small
+    def _remove_from(self, prev, node, offset):
+        del node.items[offset]
+        self.size -= 1
+
+        if not node.items:
+            # Unlink the now empty node
+            if prev is None:
+                self.head = node.next
+            else:
+                prev.next = node.next
+            if node is self.tail:
+                self.tail = prev
+            return
+
+        nxt = node.next
+        if nxt and len(node.items) < self.capacity // 2 and len(node.items) + len(nxt.items) <= self.capacity:
+            # Merge the next block into this one
+            node.items.extend(nxt.items)
+            node.next = nxt.next
+            if nxt is self.tail:
+                self.tail = node
+
+    def insert_at_beginning(self, data):
+        self.insert_at(0, data)
+
+    def insert_at_end(self, data):
+        self.insert_at(self.size, data)
+
+    # Insert a new item at a given index (O(n / capacity) node hops)
+    def insert_at(self, index, data):
+        if index < 0 or index > self.size:
+            raise Exception("Invalid Index")
+
+        if self.head is None:
+            self.head = self.tail = Node([data])
+            self.size = 1
+            return
+
+        if index == self.size:
+            self._insert_into(self.tail, len(self.tail.items), data)
+        else:
+            _, node, offset = self._find(index)
+            self._insert_into(node, offset, data)
+
+    # Remove the item at a given index (O(n / capacity) node hops)
+    def remove_at(self, index):
+        if index < 0 or index >= self.size:
+            raise Exception("Invalid Index")
+
+        self._remove_from(*self._find(index))
+
+    # Insert data_to_insert after the first occurrence of data_after
+    def insert_after_value(self, data_after, data_to_insert):
+        itr = self.head
+        while itr:
+            if data_after in itr.items:
+                self._insert_into(itr, itr.items.index(data_after) + 1, data_to_insert)
+                return
+            itr = itr.next
+
+    # Remove the first item equal to data
+    def remove_by_value(self, data):
+        prev, itr = None, self.head
+        while itr:
+            if data in itr.items:
+                self._remove_from(prev, itr, itr.items.index(data))
+                return
+            prev, itr = itr, itr.next
+
+    # Replace the contents, filling whole blocks at once (O(n))
+    def insert_values(self, data_list):
+        self.head = self.tail = None
+        self.size = 0
+        block = []
+        for data in data_list:
+            block.append(data)
+            if len(block) == self.capacity:
+                self._append_block(block)
+                block = []
+        if block:
+            self._append_block(block)
+
+    def _append_block(self, block):
+        node = Node(block)
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.size += len(block)
+
+    def get_length(self):
+        return self.size
+
+    def print(self):
+        if self.head is None:
+            print("Linked list is empty")
+            return
+
+        values = []
+        itr = self.head
+        while itr:
+            values.extend(str(data) for data in itr.items)
+            itr = itr.next
+        print(' --> '.join(values))
+
+
+if __name__ == '__main__':
+    ll = UnrolledLinkedList(capacity=4)
+    ll.insert_values(["banana", "mango", "grapes", "orange"])
+    ll.print()
+    ll.insert_after_value("mango", "apple")   # splits the first block
+    ll.print()
+    ll.remove_by_value("orange")
+    ll.print()
+    ll.insert_at(0, "figs")
+    ll.remove_at(2)
+    ll.print()
+    print("Length:", ll.get_length())
@@ -0,0 +1,152 @@
+# Queue for asyncio code: dequeue on an empty queue (and enqueue on a full one, when a
+# capacity is given) suspends the calling coroutine instead of blocking the event loop.
+#
+# Waiting coroutines each park on a future in a FIFO of waiters; whoever changes the queue
+# resolves the first waiter's future. Everything runs on the event loop's thread, so no locks.
+# A waiter cancelled after being woken passes the wakeup on, so an item (or a free slot)
+# never sits there while another coroutine keeps waiting for it.
+
+import asyncio
+from collections import deque
+
+
+class AsyncQueue:
+    def __init__(self, capacity=None):
+        self.capacity = capacity    # None: unbounded
+        self.items = deque()
+        self.getters = deque()      # futures of coroutines waiting for an item
+        self.putters = deque()      # futures of coroutines waiting for room
+
+    def _wake_next(self, waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, blocked):
+        """Suspend until blocked() is false"""
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass    # already woken: hand the wakeup to the next waiter
+                if not blocked() and not waiter.cancelled():
+                    self._wake_next(waiters)
+                raise
+
+    def is_full(self):
+        """Check if the queue is at capacity"""
+        return self.capacity is not None and len(self.items) >= self.capacity
+
+    async def enqueue(self, item):
+        """Add an item to the rear of the queue, waiting for room if it is full"""
+        if self.is_full():
+            await self._wait(self.putters, self.is_full)
+        self.enqueue_nowait(item)
+
+    def enqueue_nowait(self, item):
+        """Add an item without waiting; IndexError if the queue is full"""
+        if self.is_full():
+            raise IndexError("Enqueue to full queue")
+        self.items.append(item)
+        self._wake_next(self.getters)
+
+    async def dequeue(self):
+        """Remove and return the front item, waiting for one if the queue is empty"""
+        if not self.items:
+            await self._wait(self.getters, self.is_empty)
+        return self.dequeue_nowait()
+
+    def dequeue_nowait(self):
+        """Remove and return the front item without waiting; IndexError if empty"""
+        if not self.items:
+            raise IndexError("Dequeue from empty queue")
+        item = self.items.popleft()
+        self._wake_next(self.putters)
+        return item
+
+    def peek(self):
+        """Return the front item without removing it"""
+        if not self.items:
+            raise IndexError("Peek from empty queue")
+        return self.items[0]
+
+    def is_empty(self):
+        """Check if the queue is empty"""
+        return len(self.items) == 0
+
+    def size(self):
+        """Return the number of items in the queue"""
+        return len(self.items)
+
+    def __str__(self):
+        """Return string representation of the queue"""
+        return f"AsyncQueue({list(self.items)})"
+
+
+async def throughput(make, producers=4, consumers=4, messages=200000):
+    """Messages per second from producer to consumer coroutines through make()'s queue
+    (anything with awaitable enqueue/dequeue, or asyncio.Queue's put/get)"""
+    import time
+    queue = make()
+    put = getattr(queue, "enqueue", None) or queue.put
+    get = getattr(queue, "dequeue", None) or queue.get
+    per_producer = messages // producers
+
+    async def produce():
+        for i in range(per_producer):
+            await put(i)
+
+    async def consume():
+        while await get() is not None:
+            pass
+
+    start = time.perf_counter()
+    workers = [asyncio.create_task(consume()) for _ in range(consumers)]
+    await asyncio.gather(*(produce() for _ in range(producers)))
+    for _ in range(consumers):
+        await put(None)         # stop marker
+    await asyncio.gather(*workers)
+    return producers * per_producer / (time.perf_counter() - start)
+
+
+async def main():
+    queue = AsyncQueue(capacity=2)
+    await queue.enqueue(10)
+    await queue.enqueue(20)
+    print(f"After enqueues: {queue}")               # AsyncQueue([10, 20])
+
+    # Full: the third enqueue waits until the consumer takes an item
+    waiting = asyncio.create_task(queue.enqueue(30))
+    await asyncio.sleep(0)
+    print(f"Enqueue waiting while full: {not waiting.done()}")   # True
+    print(f"Dequeued: {await queue.dequeue()}")     # 10
+    await waiting
+    print(f"After dequeue: {queue}")                # AsyncQueue([20, 30])
+
+    # A cancelled dequeue leaves the queue untouched
+    empty = AsyncQueue()
+    getter = asyncio.create_task(empty.dequeue())
+    await asyncio.sleep(0)
+    getter.cancel()
+    empty.enqueue_nowait("x")
+    print(f"After cancelled dequeue: {empty}")      # AsyncQueue(['x'])
+
+    print()
+    print("4 producer + 4 consumer coroutines, 2*10^5 messages (messages/s)")
+    for name, make in (("asyncio.Queue", asyncio.Queue),
+                       ("AsyncQueue", AsyncQueue),
+                       ("asyncio.Queue(1000)", lambda: asyncio.Queue(1000)),
+                       ("AsyncQueue(1000)", lambda: AsyncQueue(1000))):
+        print(f"    {name:20} {await throughput(make):10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,189 @@
+# Thread-safe queue with a capacity limit, so a fast producer can't grow memory without bound.
+# What enqueue does when the queue is full is the overflow policy:
+#
+#   block        wait until a consumer makes room (backpressure on the producer)
+#   drop_oldest  discard the front item to make room (keep the freshest data)
+#   drop_newest  discard the item being enqueued (keep what is already queued)
+#   raise        raise IndexError, like dequeue on an empty queue
+#
+# Consumers can take a batch with drain(): one lock acquisition for up to max_items items,
+# instead of one per item.
+
+import threading
+import time
+from collections import deque
+
+POLICIES = ("block", "drop_oldest", "drop_newest", "raise")
+
+
+class BoundedQueue:
+    def __init__(self, capacity, overflow="block"):
+        if overflow not in POLICIES:
+            raise ValueError(f"overflow must be one of {POLICIES}")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.items = deque()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        self.dropped = 0    # items discarded by the drop policies
+
+    def _wait(self, condition, ready, timeout):
+        """Wait on condition (lock held) until ready() or timeout; return ready()"""
+        if timeout is None:
+            while not ready():
+                condition.wait()
+            return True
+        deadline = time.monotonic() + timeout
+        while not ready():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            condition.wait(remaining)
+        return True
+
+    def _put(self, item, timeout):
+        """Enqueue one item under the lock, applying the overflow policy.
+        Returns True if the item was queued."""
+        if len(self.items) >= self.capacity:
+            if self.overflow == "block":
+                if not self._wait(self.not_full, lambda: len(self.items) < self.capacity, timeout):
+                    raise IndexError("Enqueue to full queue")
+            elif self.overflow == "drop_oldest":
+                self.items.popleft()
+                self.dropped += 1
+            elif self.overflow == "drop_newest":
+                self.dropped += 1
+                return False
+            else:
+                raise IndexError("Enqueue to full queue")
+        self.items.append(item)
+        return True
+
+    def enqueue(self, item, timeout=None):
+        """Add an item to the rear of the queue.
+        Returns False if the drop_newest policy discarded it. With the block policy,
+        timeout limits the wait for room (IndexError when it runs out)."""
+        with self.lock:
+            added = self._put(item, timeout)
+            if added:
+                self.not_empty.notify()
+            return added
+
+    def enqueue_many(self, items, timeout=None):
+        """Add items in order under one lock acquisition (released only while blocked
+        waiting for room). Returns how many were queued; if a timeout or the raise
+        policy stops it part way, the items before that stay queued."""
+        added = 0
+        with self.lock:
+            for item in items:
+                if self._put(item, timeout):
+                    added += 1
+                    self.not_empty.notify()
+        return added
+
+    def dequeue(self, block=True, timeout=None):
+        """Remove and return the front item.
+        block=False, or no item within timeout seconds, raises IndexError."""
+        with self.lock:
+            if not self._wait(self.not_empty, lambda: self.items, timeout if block else 0):
+                raise IndexError("Dequeue from empty queue")
+            item = self.items.popleft()
+            self.not_full.notify()
+            return item
+
+    def drain(self, max_items=None, timeout=None):
+        """Remove and return up to max_items front items (all of them if None) as a list,
+        under one lock acquisition. Waits up to timeout seconds for the first item
+        (forever if None, not at all if 0) and returns [] if none came."""
+        with self.lock:
+            if not self._wait(self.not_empty, lambda: self.items, timeout):
+                return []
+            n = len(self.items) if max_items is None else min(max_items, len(self.items))
+            popleft = self.items.popleft
+            batch = [popleft() for _ in range(n)]
+            self.not_full.notify(n)
+            return batch
+
+    def peek(self):
+        """Return the front item without removing it"""
+        with self.lock:
+            if not self.items:
+                raise IndexError("Peek from empty queue")
+            return self.items[0]
+
+    def is_empty(self):
+        """Check if the queue is empty"""
+        return len(self.items) == 0
+
+    def is_full(self):
+        """Check if the queue is at capacity"""
+        return len(self.items) >= self.capacity
+
+    def size(self):
+        """Return the number of items in the queue"""
+        return len(self.items)
+
+    def __str__(self):
+        """Return string representation of the queue"""
+        with self.lock:
+            return f"BoundedQueue({list(self.items)}, capacity={self.capacity})"
+
+
+def throughput(batch, producers=4, consumers=4, items_per_producer=50000, capacity=1000):
+    """Items per second through a blocking BoundedQueue, consumers taking one item
+    per dequeue (batch=None) or up to `batch` per drain"""
+    queue = BoundedQueue(capacity)
+    done = object()
+
+    def produce():
+        for i in range(items_per_producer):
+            queue.enqueue(i)
+
+    def consume():
+        while True:
+            items = queue.drain(batch) if batch else [queue.dequeue()]
+            if done in items:
+                extra = items.count(done) - 1
+                if extra:
+                    queue.enqueue_many([done] * extra)   # a batch took other consumers' markers
+                return
+
+    producer_threads = [threading.Thread(target=produce) for _ in range(producers)]
+    consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    start = time.perf_counter()
+    for t in producer_threads + consumer_threads:
+        t.start()
+    for t in producer_threads:
+        t.join()
+    for _ in consumer_threads:
+        queue.enqueue(done)
+    for t in consumer_threads:
+        t.join()
+    return producers * items_per_producer / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    for policy in ("drop_oldest", "drop_newest"):
+        queue = BoundedQueue(3, overflow=policy)
+        for i in range(5):
+            queue.enqueue(i)
+        print(f"{policy:12} {queue}  dropped={queue.dropped}")
+    # drop_oldest  BoundedQueue([2, 3, 4], capacity=3)  dropped=2
+    # drop_newest  BoundedQueue([0, 1, 2], capacity=3)  dropped=2
+
+    queue = BoundedQueue(2, overflow="raise")
+    queue.enqueue_many(["a", "b"])
+    try:
+        queue.enqueue("c")
+    except IndexError as e:
+        print("raise:", e)
+    print("drain:", queue.drain(10), queue.drain(timeout=0))   # ['a', 'b'] []
+
+    print()
+    print("4 producers + 4 consumers, capacity 1000 (items/s)")
+    for batch in (None, 10, 100):
+        label = "dequeue per item" if batch is None else f"drain({batch})"
+        print(f"    {label:17} {throughput(batch):10.0f}")
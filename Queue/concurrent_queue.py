@@ -0,0 +1,230 @@
+# Multi-producer / multi-consumer queue for threads.
+#
+# deque.append, deque.extend and deque.popleft are each atomic in CPython (they run in C
+# without releasing the GIL), so enqueueing and a dequeue that finds an item take no lock
+# at all. The lock is only used to park consumers on an empty queue and to wake them up:
+# a consumer registers itself as waiting *before* its last look at the deque, and a
+# producer checks for waiters *after* appending, so a wakeup can't be missed.
+#
+# Nothing here imports the standard library's queue module: scripts run from this directory
+# would get Queue/queue.py instead.
+
+import threading
+import time
+from collections import deque
+
+
+class ConcurrentQueue:
+    def __init__(self):
+        self.items = deque()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.waiting = 0    # consumers parked in not_empty.wait()
+
+    def enqueue(self, item):
+        """Add an item to the rear of the queue"""
+        self.items.append(item)
+        if self.waiting:
+            with self.lock:
+                self.not_empty.notify()
+
+    def enqueue_many(self, items):
+        """Add all items to the rear of the queue, in order, as one atomic extend"""
+        items = list(items)
+        self.items.extend(items)
+        if self.waiting:
+            with self.lock:
+                self.not_empty.notify(len(items))
+
+    def dequeue(self, block=True, timeout=None):
+        """Remove and return the front item.
+        block=False, or no item within timeout seconds, raises IndexError."""
+        try:
+            return self.items.popleft()
+        except IndexError:
+            if not block:
+                raise IndexError("Dequeue from empty queue") from None
+        return self._wait_popleft(timeout)
+
+    def dequeue_many(self, max_items, block=True, timeout=None):
+        """Remove and return up to max_items front items as a list.
+        Waits like dequeue for the first item, then takes whatever else is there.
+        Other consumers may dequeue concurrently, so a batch need not be contiguous."""
+        batch = []
+        popleft = self.items.popleft
+        try:
+            while len(batch) < max_items:
+                batch.append(popleft())
+        except IndexError:
+            if batch:
+                return batch
+            if not block:
+                raise IndexError("Dequeue from empty queue") from None
+            batch.append(self._wait_popleft(timeout))
+            try:
+                while len(batch) < max_items:
+                    batch.append(popleft())
+            except IndexError:
+                pass
+        return batch
+
+    def _wait_popleft(self, timeout):
+        """Block until an item can be dequeued and return it; raise IndexError on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.not_empty:
+            self.waiting += 1
+            try:
+                while True:
+                    try:
+                        return self.items.popleft()
+                    except IndexError:
+                        pass
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise IndexError("Dequeue from empty queue")
+                    self.not_empty.wait(remaining)
+            finally:
+                self.waiting -= 1
+
+    def peek(self):
+        """Return the front item without removing it"""
+        try:
+            return self.items[0]
+        except IndexError:
+            raise IndexError("Peek from empty queue") from None
+
+    def is_empty(self):
+        """Check if the queue is empty (only a hint while other threads are active)"""
+        return len(self.items) == 0
+
+    def size(self):
+        """Return the number of items in the queue (only a hint while other threads are active)"""
+        return len(self.items)
+
+    def __str__(self):
+        """Return string representation of the queue"""
+        return f"ConcurrentQueue({list(self.items)})"
+
+
+# ---------------- benchmark: the three queue.py implementations vs ConcurrentQueue ----------------
+
+class _ListQueue:
+    """Method 1 of queue.py: list with pop(0)"""
+
+    def __init__(self):
+        self.items = []
+
+    def enqueue(self, item):
+        self.items.append(item)
+
+    def dequeue(self):
+        if self.items:
+            return self.items.pop(0)   # can still raise if another thread got there first
+        raise IndexError("Dequeue from empty queue")
+
+
+class _DequeQueue(_ListQueue):
+    """Method 2 of queue.py: deque with popleft"""
+
+    def __init__(self):
+        self.items = deque()
+
+    def dequeue(self):
+        if self.items:
+            return self.items.popleft()
+        raise IndexError("Dequeue from empty queue")
+
+
+class _LockedQueue:
+    """Method 3 of queue.py: the standard library's queue.Queue (one mutex for everything)"""
+
+    def __init__(self):
+        self.items = _stdlib_queue().Queue()
+
+    def enqueue(self, item):
+        self.items.put(item)
+
+    def dequeue(self):
+        if not self.items.empty():
+            return self.items.get()
+        raise IndexError("Dequeue from empty queue")
+
+
+def _stdlib_queue():
+    """The standard library's queue module, even when Queue/queue.py shadows it"""
+    import importlib.util
+    import sysconfig
+    path = sysconfig.get_paths()["stdlib"] + "/queue.py"
+    spec = importlib.util.spec_from_file_location("_stdlib_queue", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def throughput(queue, producers, consumers, items_per_producer=50000, batch=None):
+    """Items per second moved from producers to consumers.
+    Queues without blocking dequeue are polled; batch uses enqueue_many / dequeue_many."""
+    blocking = isinstance(queue, ConcurrentQueue)
+    done = object()
+
+    def produce():
+        if batch:
+            for start in range(0, items_per_producer, batch):
+                queue.enqueue_many(range(start, min(start + batch, items_per_producer)))
+        else:
+            for i in range(items_per_producer):
+                queue.enqueue(i)
+
+    def consume():
+        while True:
+            if batch:
+                items = queue.dequeue_many(batch)
+            elif blocking:
+                items = [queue.dequeue()]
+            else:
+                try:
+                    items = [queue.dequeue()]
+                except IndexError:
+                    continue
+            if done in items:
+                extra = items.count(done) - 1
+                if extra:
+                    queue.enqueue_many([done] * extra)   # a batch took other consumers' markers
+                return
+
+    producer_threads = [threading.Thread(target=produce) for _ in range(producers)]
+    consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    start = time.perf_counter()
+    for t in producer_threads + consumer_threads:
+        t.start()
+    for t in producer_threads:
+        t.join()
+    for _ in consumer_threads:
+        queue.enqueue(done)    # one stop marker per consumer, after all the real items
+    for t in consumer_threads:
+        t.join()
+    return producers * items_per_producer / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    queue = ConcurrentQueue()
+    queue.enqueue_many([10, 20, 30])
+    print(queue)                                   # ConcurrentQueue([10, 20, 30])
+    print("Dequeued:", queue.dequeue_many(2))      # [10, 20]
+    print("Front element:", queue.peek())          # 30
+    queue.dequeue()
+    try:
+        queue.dequeue(timeout=0.01)
+    except IndexError as e:
+        print("Timed out:", e)
+
+    print()
+    print(f"{'producers+consumers':>19} {'list':>10} {'deque':>10} {'queue.Queue':>12} "
+          f"{'Concurrent':>11} {'batch of 100':>13}   (items/s)")
+    for threads in (8, 16):
+        half = threads // 2
+        rates = [throughput(q, half, half) for q in
+                 (_ListQueue(), _DequeQueue(), _LockedQueue(), ConcurrentQueue())]
+        rates.append(throughput(ConcurrentQueue(), half, half, batch=100))
+        print(f"{half:>9} + {half:<9} {rates[0]:10.0f} {rates[1]:10.0f} {rates[2]:12.0f} "
+              f"{rates[3]:11.0f} {rates[4]:13.0f}")
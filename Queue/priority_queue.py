@@ -0,0 +1,299 @@
+# Priority queues on a d-ary heap: a list where the node at index i has its children at
+# d*i + 1 ... d*i + d and no child has a smaller priority than its parent, so the front
+# (smallest priority) is always at index 0. enqueue sifts the new entry up, dequeue moves the
+# last entry to the root and sifts it down: O(log n) each, no re-sorting.
+#
+# d = 2 is the classic binary heap. A larger d makes the tree shallower (cheaper sift up,
+# so cheaper enqueue / decrease_key) at the cost of comparing more children on the way down.
+#
+# Equal priorities come out in the order they were enqueued (ties are broken by a counter).
+#
+# IndexedPriorityQueue also remembers where every item sits in the heap, so an item's
+# priority can be changed (decrease_key) or the item removed in O(log n).
+
+import itertools
+
+
+class PriorityQueue:
+    def __init__(self, d=2):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        self.heap = []                    # (priority, order, item) entries
+        self.counter = itertools.count()
+
+    def _sift_up(self, i):
+        heap, d = self.heap, self.d
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if entry >= heap[parent]:
+                break
+            heap[i] = heap[parent]
+            i = parent
+        heap[i] = entry
+
+    def _sift_down(self, i):
+        heap, d = self.heap, self.d
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            child, smallest = first, heap[first]
+            for j in range(first + 1, min(first + d, n)):
+                if heap[j] < smallest:
+                    child, smallest = j, heap[j]
+            if smallest >= entry:
+                break
+            heap[i] = smallest
+            i = child
+        heap[i] = entry
+
+    def enqueue(self, item, priority):
+        """Add an item with a priority (smaller comes out first)"""
+        self.heap.append((priority, next(self.counter), item))
+        self._sift_up(len(self.heap) - 1)
+
+    def dequeue(self):
+        """Remove and return the item with the smallest priority"""
+        if not self.heap:
+            raise IndexError("Dequeue from empty queue")
+        last = self.heap.pop()
+        if not self.heap:
+            return last[2]
+        front = self.heap[0]
+        self.heap[0] = last
+        self._sift_down(0)
+        return front[2]
+
+    def peek(self):
+        """Return the item with the smallest priority without removing it"""
+        if not self.heap:
+            raise IndexError("Peek from empty queue")
+        return self.heap[0][2]
+
+    def is_empty(self):
+        """Check if the queue is empty"""
+        return len(self.heap) == 0
+
+    def size(self):
+        """Return the number of items in the queue"""
+        return len(self.heap)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __str__(self):
+        """Return string representation of the queue, front first"""
+        return f"{type(self).__name__}({[(item, priority) for priority, _, item in sorted(self.heap)]})"
+
+
+class IndexedPriorityQueue(PriorityQueue):
+    """PriorityQueue of distinct, hashable items, with decrease_key and remove.
+    self.position maps each item to the index of its entry in the heap."""
+
+    def __init__(self, d=2):
+        super().__init__(d)
+        self.position = {}
+
+    # The sifts of PriorityQueue, also updating position for every entry they move
+
+    def _sift_up(self, i):
+        heap, d, position = self.heap, self.d, self.position
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if entry >= heap[parent]:
+                break
+            heap[i] = heap[parent]
+            position[heap[i][2]] = i
+            i = parent
+        heap[i] = entry
+        position[entry[2]] = i
+
+    def _sift_down(self, i):
+        heap, d, position = self.heap, self.d, self.position
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            child, smallest = first, heap[first]
+            for j in range(first + 1, min(first + d, n)):
+                if heap[j] < smallest:
+                    child, smallest = j, heap[j]
+            if smallest >= entry:
+                break
+            heap[i] = smallest
+            position[heap[i][2]] = i
+            i = child
+        heap[i] = entry
+        position[entry[2]] = i
+
+    def enqueue(self, item, priority):
+        """Add an item with a priority; ValueError if the item is already queued"""
+        if item in self.position:
+            raise ValueError(f"{item!r} is already in the queue")
+        super().enqueue(item, priority)
+
+    def _take(self, i):
+        """Remove and return the entry at index i"""
+        heap = self.heap
+        last = heap.pop()
+        if i == len(heap):
+            del self.position[last[2]]
+            return last
+        entry = heap[i]
+        del self.position[entry[2]]
+        heap[i] = last
+        # The moved entry can belong above or below its new spot
+        if i > 0 and last < heap[(i - 1) // self.d]:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+        return entry
+
+    def dequeue(self):
+        """Remove and return the item with the smallest priority"""
+        if not self.heap:
+            raise IndexError("Dequeue from empty queue")
+        return self._take(0)[2]
+
+    def remove(self, item):
+        """Remove an item from anywhere in the queue (O(log n)); KeyError if absent"""
+        if item not in self.position:
+            raise KeyError(f"{item} not found")
+        self._take(self.position[item])
+
+    def decrease_key(self, item, priority):
+        """Lower an item's priority (O(log n)); ValueError if priority is higher than its current one"""
+        i = self.position.get(item)
+        if i is None:
+            raise KeyError(f"{item} not found")
+        old, order, _ = self.heap[i]
+        if priority > old:
+            raise ValueError(f"new priority {priority!r} is higher than {old!r}")
+        self.heap[i] = (priority, order, item)
+        self._sift_up(i)
+
+    def priority(self, item):
+        """Current priority of a queued item; KeyError if absent"""
+        if item not in self.position:
+            raise KeyError(f"{item} not found")
+        return self.heap[self.position[item]][0]
+
+    def __contains__(self, item):
+        return item in self.position
+
+
+# ---------------- benchmark: heapq and a sorted list vs the heaps above ----------------
+
+def push_pop(make, n, seed=5):
+    """Seconds to enqueue n random priorities and dequeue them all"""
+    import random
+    import time
+    enqueue, dequeue = make()
+    priorities = random.Random(seed).sample(range(n * 10), n)
+    start = time.perf_counter()
+    for item, priority in enumerate(priorities):
+        enqueue(item, priority)
+    for _ in range(n):
+        dequeue()
+    return time.perf_counter() - start
+
+
+def _heapq():
+    import heapq
+    heap, counter = [], itertools.count()
+    return (lambda item, priority: heapq.heappush(heap, (priority, next(counter), item)),
+            lambda: heapq.heappop(heap)[2])
+
+
+def _sorted_list():
+    import bisect
+    entries, counter = [], itertools.count()
+    # Kept in descending order so the smallest priority pops off the end
+    return (lambda item, priority: bisect.insort(entries, (-priority, -next(counter), item)),
+            lambda: entries.pop()[2])
+
+
+def _heap(d):
+    def make():
+        queue = PriorityQueue(d)
+        return queue.enqueue, queue.dequeue
+    return make
+
+
+def decrease_keys(n, updates, seed=6):
+    """Seconds for n items plus `updates` random priority decreases, then draining:
+    heapq with lazy deletion (push a new entry, skip stale ones when popping)
+    vs IndexedPriorityQueue.decrease_key"""
+    import heapq
+    import random
+    import time
+    rng = random.Random(seed)
+    changes = [(rng.randrange(n), rng.random()) for _ in range(updates)]
+
+    start = time.perf_counter()
+    best, heap = {}, []
+    for item in range(n):
+        best[item] = 1.0 + item
+        heap.append((best[item], item))
+    heapq.heapify(heap)
+    for item, factor in changes:
+        best[item] *= factor
+        heapq.heappush(heap, (best[item], item))
+    done = set()
+    while heap:
+        priority, item = heapq.heappop(heap)
+        if item not in done and priority == best[item]:
+            done.add(item)
+    lazy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    queue = IndexedPriorityQueue(d=4)
+    for item in range(n):
+        queue.enqueue(item, 1.0 + item)
+    for item, factor in changes:
+        if item in queue:
+            queue.decrease_key(item, queue.priority(item) * factor)
+    while queue.heap:
+        queue.dequeue()
+    indexed = time.perf_counter() - start
+    return lazy, indexed
+
+
+if __name__ == "__main__":
+    queue = PriorityQueue()
+    queue.enqueue("write report", 3)
+    queue.enqueue("fix bug", 1)
+    queue.enqueue("review", 2)
+    queue.enqueue("lunch", 1)               # same priority as fix bug: comes after it
+    print(queue)
+    print(f"Front element: {queue.peek()}")   # fix bug
+    print(f"Dequeued: {queue.dequeue()}")     # fix bug
+    print(f"Dequeued: {queue.dequeue()}")     # lunch
+
+    tasks = IndexedPriorityQueue(d=4)
+    for name, priority in (("a", 5), ("b", 4), ("c", 3), ("d", 2)):
+        tasks.enqueue(name, priority)
+    tasks.decrease_key("a", 1)              # a jumps to the front
+    tasks.remove("d")
+    print(tasks)                            # IndexedPriorityQueue([('a', 1), ('c', 3), ('b', 4)])
+
+    print()
+    print("Enqueue n random priorities, then dequeue them all")
+    # heapq's sifts run in C, so it stays ahead of the pure Python heaps; the sorted list
+    # shifts its entries on every insort, which is O(n^2) overall and falls behind as n grows
+    for n in (10 ** 4, 10 ** 5, 3 * 10 ** 5):
+        results = {"heapq": push_pop(_heapq, n), "binary": push_pop(_heap(2), n),
+                   "4-ary": push_pop(_heap(4), n), "sorted list": push_pop(_sorted_list, n)}
+        print(f"    n={n:<7}" + "".join(f" {name} {t:6.3f}s " for name, t in results.items()))
+
+    print()
+    print("10^5 items, 3*10^5 priority decreases, then drain")
+    lazy, indexed = decrease_keys(10 ** 5, 3 * 10 ** 5)
+    print(f"    heapq + lazy deletion {lazy:6.3f}s   IndexedPriorityQueue.decrease_key {indexed:6.3f}s")
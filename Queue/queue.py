@@ -126,26 +126,13 @@ class Queue:
         raise IndexError("Dequeue from empty queue")
     
     def peek(self):
-        """Return the front item without removing it (not natively supported)"""
-        if self.is_empty():
-            raise IndexError("Peek from empty queue")
-        
-        # Create a temporary queue to access elements
-        temp = ThreadSafeQueue()
-        front_item = None
-        
-        # Move all items to temporary queue to access the front
-        while not self.items.empty():
-            item = self.items.get()
-            if front_item is None:  # First item we get is the front
-                front_item = item
-            temp.put(item)
-        
-        # Restore the original queue
-        while not temp.empty():
-            self.items.put(temp.get())
-            
-        return front_item
+        """Return the front item without removing it (O(1))"""
+        # The wrapped Queue keeps its items in .queue and guards them with .mutex;
+        # reading under that lock is atomic with respect to put / get in other threads
+        with self.items.mutex:
+            if not self.items.queue:
+                raise IndexError("Peek from empty queue")
+            return self.items.queue[0]
     
     def is_empty(self):
         """Check if the queue is empty"""
@@ -157,14 +144,16 @@ class Queue:
     
     def __str__(self):
         """Return string representation of the queue"""
-        # Not straightforward with ThreadSafeQueue, so we'll skip it
-        return "Queue (ThreadSafe implementation)"
+        # Snapshot taken under the Queue's own lock, so it is consistent
+        with self.items.mutex:
+            return f"Queue({list(self.items.queue)})"
 
 # Example usage
 queue = Queue()
 queue.enqueue(1)
 queue.enqueue(2)
 queue.enqueue(3)
+print(queue)  # Queue([1, 2, 3])
 print(f"Size: {queue.size()}")  # Size: 3
 print(f"Front element: {queue.peek()}")  # Front element: 1
 print(f"Dequeued: {queue.dequeue()}")  # Dequeued: 1
@@ -0,0 +1,138 @@
+# Queue on a circular buffer: a preallocated list plus the index of the front item.
+# dequeue just moves the front index forward instead of shifting every element like
+# list.pop(0), so both enqueue and dequeue are O(1) (enqueue amortized: when the buffer is
+# full it is copied, in queue order, into one twice as large).
+#
+# The capacity is kept a power of two so wrapping an index around is a bit mask.
+# collections.deque does the same job in C and stays faster; this is the pure Python version
+# of the idea, and it fixes the list version's O(n^2) drain.
+
+
+class RingBufferQueue:
+    def __init__(self, capacity=16):
+        size = 1
+        while size < capacity:
+            size *= 2
+        self.buffer = [None] * size
+        self.mask = size - 1
+        self.front = 0    # index of the front item
+        self.count = 0
+
+    def _grow(self):
+        old, front = self.buffer, self.front
+        self.buffer = old[front:] + old[:front] + [None] * len(old)   # unwrapped, front at 0
+        self.mask = len(self.buffer) - 1
+        self.front = 0
+
+    def enqueue(self, item):
+        """Add an item to the rear of the queue"""
+        if self.count > self.mask:
+            self._grow()
+        self.buffer[(self.front + self.count) & self.mask] = item
+        self.count += 1
+
+    def dequeue(self):
+        """Remove and return the front item from the queue"""
+        if self.count == 0:
+            raise IndexError("Dequeue from empty queue")
+        item = self.buffer[self.front]
+        self.buffer[self.front] = None   # drop the reference so the item can be freed
+        self.front = (self.front + 1) & self.mask
+        self.count -= 1
+        return item
+
+    def peek(self):
+        """Return the front item without removing it"""
+        if self.count == 0:
+            raise IndexError("Peek from empty queue")
+        return self.buffer[self.front]
+
+    def is_empty(self):
+        """Check if the queue is empty"""
+        return self.count == 0
+
+    def size(self):
+        """Return the number of items in the queue"""
+        return self.count
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """Items from front to rear"""
+        for i in range(self.count):
+            yield self.buffer[(self.front + i) & self.mask]
+
+    def __str__(self):
+        """Return string representation of the queue"""
+        return f"Queue({list(self)})"
+
+
+# ---------------- benchmark: list pop(0) and deque (queue.py methods 1 and 2) vs the ring buffer ----------------
+
+def fill_then_drain(make, n):
+    """Seconds to enqueue n items and then dequeue them all"""
+    import time
+    enqueue, dequeue = make()
+    start = time.perf_counter()
+    for i in range(n):
+        enqueue(i)
+    for _ in range(n):
+        dequeue()
+    return time.perf_counter() - start
+
+
+def steady_state(make, ops, resident):
+    """Seconds for ops alternating enqueue / dequeue calls on a queue holding `resident` items"""
+    import time
+    enqueue, dequeue = make()
+    for i in range(resident):
+        enqueue(i)
+    start = time.perf_counter()
+    for i in range(ops // 2):
+        enqueue(i)
+        dequeue()
+    return time.perf_counter() - start
+
+
+def _list():
+    items = []
+    return items.append, lambda: items.pop(0)
+
+
+def _deque():
+    from collections import deque
+    items = deque()
+    return items.append, items.popleft
+
+
+def _ring():
+    queue = RingBufferQueue()
+    return queue.enqueue, queue.dequeue
+
+
+if __name__ == "__main__":
+    queue = RingBufferQueue(capacity=2)
+    queue.enqueue(10)
+    queue.enqueue(20)
+    print(f"Dequeued: {queue.dequeue()}")   # 10
+    queue.enqueue(30)                       # wraps around to slot 0
+    queue.enqueue(40)                       # full: grows to 4 slots
+    print(f"After enqueues: {queue}")       # Queue([20, 30, 40])
+    print(f"Front element: {queue.peek()}")  # 20
+    print(f"Size: {queue.size()}")          # 3
+
+    print()
+    print("Enqueue n, then dequeue n (2n operations)")
+    for n in (10 ** 4, 10 ** 5, 10 ** 6):
+        # list.pop(0) draining is quadratic: already ~40s at 5*10^5, so it sits out 10^6
+        listed = f"{fill_then_drain(_list, n):7.3f}s" if n <= 10 ** 5 else "   (skip)"
+        results = [fill_then_drain(make, n) for make in (_deque, _ring)]
+        print(f"    n={n:<7} list {listed}   deque {results[0]:6.3f}s   ring buffer {results[1]:6.3f}s")
+
+    print()
+    print("10^6 alternating enqueue / dequeue")
+    for resident in (10, 10 ** 4, 10 ** 5):
+        results = [steady_state(make, 10 ** 6, resident) for make in (_list, _deque, _ring)]
+        print(f"    {resident:>6} items queued: list {results[0]:6.3f}s   deque {results[1]:6.3f}s   "
+              f"ring buffer {results[2]:6.3f}s")
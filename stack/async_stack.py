@@ -0,0 +1,115 @@
+# Stack for asyncio code: AsyncQueue (Queue/async_queue.py) with the items taken from the
+# top instead of the front. Waiting for an item or for room, and cancellation, work the same
+# way; see async_queue.py for how.
+
+import asyncio
+from collections import deque
+
+
+class AsyncStack:
+    def __init__(self, capacity=None):
+        self.capacity = capacity    # None: unbounded
+        self.items = []
+        self.getters = deque()      # futures of coroutines waiting for an item
+        self.putters = deque()      # futures of coroutines waiting for room
+
+    # Waiter handling as in AsyncQueue
+
+    def _wake_next(self, waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, blocked):
+        """Suspend until blocked() is false"""
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass    # already woken: hand the wakeup to the next waiter
+                if not blocked() and not waiter.cancelled():
+                    self._wake_next(waiters)
+                raise
+
+    def is_full(self):
+        """Check if the stack is at capacity"""
+        return self.capacity is not None and len(self.items) >= self.capacity
+
+    async def push(self, item):
+        """Add an item to the top of the stack, waiting for room if it is full"""
+        if self.is_full():
+            await self._wait(self.putters, self.is_full)
+        self.push_nowait(item)
+
+    def push_nowait(self, item):
+        """Add an item without waiting; IndexError if the stack is full"""
+        if self.is_full():
+            raise IndexError("Push to full stack")
+        self.items.append(item)
+        self._wake_next(self.getters)
+
+    async def pop(self):
+        """Remove and return the top item, waiting for one if the stack is empty"""
+        if not self.items:
+            await self._wait(self.getters, self.is_empty)
+        return self.pop_nowait()
+
+    def pop_nowait(self):
+        """Remove and return the top item without waiting; IndexError if empty"""
+        if not self.items:
+            raise IndexError("Pop from empty stack")
+        item = self.items.pop()
+        self._wake_next(self.putters)
+        return item
+
+    def peek(self):
+        """Return the top item without removing it"""
+        if not self.items:
+            raise IndexError("Peek from empty stack")
+        return self.items[-1]
+
+    def is_empty(self):
+        """Check if the stack is empty"""
+        return len(self.items) == 0
+
+    def size(self):
+        """Return the number of items in the stack"""
+        return len(self.items)
+
+    def __str__(self):
+        """Return string representation of the stack"""
+        return f"AsyncStack({list(self.items)})"
+
+
+async def main():
+    stack = AsyncStack(capacity=2)
+    await stack.push(10)
+    await stack.push(20)
+    print(f"After pushes: {stack}")                 # AsyncStack([10, 20])
+
+    # Full: the third push waits until a pop makes room
+    waiting = asyncio.create_task(stack.push(30))
+    await asyncio.sleep(0)
+    print(f"Push waiting while full: {not waiting.done()}")   # True
+    print(f"Popped: {await stack.pop()}")           # 20
+    await waiting
+    print(f"Top element: {stack.peek()}")           # 30
+
+    # pop on an empty stack suspends until something is pushed
+    empty = AsyncStack()
+    popper = asyncio.create_task(empty.pop())
+    await asyncio.sleep(0)
+    await empty.push("x")
+    print(f"Popped after waiting: {await popper}")  # x
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
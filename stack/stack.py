@@ -125,27 +125,13 @@ class Stack:
         raise IndexError("Pop from empty stack")
     
     def peek(self):
-        """Return the top item without removing it (not natively supported)"""
-        # LifoQueue doesn't have a peek method, so we need to implement it
-        if self.is_empty():
-            raise IndexError("Peek from empty stack")
-        
-        # Temporary storage
-        temp = LifoQueue()
-        top_item = None
-        
-        # Move all items to temporary queue to access the top
-        while not self.items.empty():
-            item = self.items.get()
-            if top_item is None:  # First item we get is the top
-                top_item = item
-            temp.put(item)
-        
-        # Restore the original stack
-        while not temp.empty():
-            self.items.put(temp.get())
-            
-        return top_item
+        """Return the top item without removing it (O(1))"""
+        # The wrapped LifoQueue keeps its items in .queue and guards them with .mutex;
+        # reading under that lock is atomic with respect to put / get in other threads
+        with self.items.mutex:
+            if not self.items.queue:
+                raise IndexError("Peek from empty stack")
+            return self.items.queue[-1]
     
     def is_empty(self):
         """Check if the stack is empty"""
@@ -157,14 +143,16 @@ class Stack:
     
     def __str__(self):
         """Return string representation of the stack"""
-        # Not straightforward with LifoQueue, so we'll skip it
-        return "Stack (LifoQueue implementation)"
+        # Snapshot taken under the LifoQueue's own lock, so it is consistent
+        with self.items.mutex:
+            return f"Stack({list(self.items.queue)})"
 
 # Example usage
 stack = Stack()
 stack.push(1)
 stack.push(2)
 stack.push(3)
+print(stack)  # Stack([1, 2, 3])
 print(f"Size: {stack.size()}")  # Size: 3
 print(f"Top element: {stack.peek()}")  # Top element: 3
 print(f"Popped: {stack.pop()}")  # Popped: 3
\ No newline at end of file